@@ -61,10 +61,13 @@ if db_type == 'postgresql' or db_type == 'postgres':
         app.config['SQLALCHEMY_DATABASE_URI'] = f'postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}'
 else:
     # SQLite configuration
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///pollingplaces.db'
+    sqlite_path = os.getenv('SQLITE_PATH', 'pollingplaces.db')
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{sqlite_path}'
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
+# Skip the per-request last_used_at write (the test suite turns this on)
+app.config['SKIP_LAST_USED_UPDATE'] = False
 
 # Load configuration
 config_file = os.path.join(os.path.dirname(__file__), 'config.json')
@@ -256,8 +259,9 @@ def require_api_key(f):
             return jsonify({'error': 'Invalid or inactive API key'}), 401
 
         # Update last used timestamp
-        key_obj.last_used_at = datetime.utcnow()
-        db.session.commit()
+        if not app.config.get('SKIP_LAST_USED_UPDATE'):
+            key_obj.last_used_at = datetime.utcnow()
+            db.session.commit()
 
         # Store key object in request context for potential use
         request.api_key = key_obj
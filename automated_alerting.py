@@ -9,7 +9,7 @@ import time
 import json
 import asyncio
 import smtplib
-from typing import Dict, Any, Optional, List, Callable, Union
+from typing import Dict, Any, Optional, List, Callable, Union, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
@@ -30,7 +30,11 @@ except ImportError:
     REDIS_AVAILABLE = False
     RedisType = None
 
+if TYPE_CHECKING:
+    from error_tracking import ErrorTracker
+
 # Import with fallback
+error_tracker: Optional['ErrorTracker']
 try:
     from structured_logging import get_logger
     from error_tracking import error_tracker
@@ -9,6 +9,9 @@ import os
 import sys
 import traceback
 import time
+import threading
+import uuid
+from array import array
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, List, Callable, Union
 from functools import wraps
@@ -38,6 +41,13 @@ class ErrorTracker:
             'last_error': None
         }
         
+        # Per-type counts live in a flat array indexed by an interned type id;
+        # the lock is only taken the first time a given type is seen
+        self._type_ids: Dict[type, int] = {}
+        self._type_names: List[str] = []
+        self._type_counts = array('Q')
+        self._type_lock = threading.Lock()
+        
         if app:
             self.init_app(app)
     
@@ -56,16 +66,53 @@ class ErrorTracker:
             environment=getattr(app, 'config', {}).get('ENV', 'development')
         )
     
-    def _handle_exception(self, exception: Exception) -> Response:
-        """Handle uncaught exceptions"""
-        # Update error stats
+    def _register_error_type(self, error_type: type) -> int:
+        """Assign an id to an error type the first time it is seen"""
+        with self._type_lock:
+            type_id = self._type_ids.get(error_type)
+            if type_id is None:
+                type_id = len(self._type_names)
+                self._type_names.append(error_type.__name__)
+                self._type_counts.append(0)
+                self._type_ids[error_type] = type_id
+            return type_id
+    
+    def _record_error(self, exception: Exception):
+        """Bump the total and per-type counters for an exception"""
+        error_type = type(exception)
+        type_id = self._type_ids.get(error_type)
+        if type_id is None:
+            type_id = self._register_error_type(error_type)
+        self._type_counts[type_id] += 1
+        
         self.error_stats['total_errors'] += 1
-        self.error_stats['system_errors'] += 1
         self.error_stats['last_error'] = {
             'timestamp': datetime.utcnow().isoformat(),
-            'type': type(exception).__name__,
+            'type': error_type.__name__,
             'message': str(exception)
         }
+    
+    def track_error(self, error: Exception, context: Optional[Dict[str, Any]] = None) -> str:
+        """Record a handled exception and return an id for it"""
+        self._record_error(error)
+        error_id = str(uuid.uuid4())
+        
+        self.logger.error(
+            f"Tracked error: {str(error)}",
+            extra={
+                'error_id': error_id,
+                'exception_type': type(error).__name__,
+                'context': context or {}
+            }
+        )
+        
+        return error_id
+    
+    def _handle_exception(self, exception: Exception) -> Response:
+        """Handle uncaught exceptions"""
+        # Update error stats
+        self._record_error(exception)
+        self.error_stats['system_errors'] += 1
         
         # Log to structured logger
         self.logger.error(
@@ -139,8 +186,15 @@ class ErrorTracker:
     
     def get_error_stats(self) -> Dict[str, Any]:
         """Get error statistics"""
+        # Registration only ever appends, so zip never pairs a name with a
+        # count slot that does not exist yet
+        error_types: Dict[str, int] = {}
+        for name, count in zip(self._type_names, self._type_counts):
+            error_types[name] = error_types.get(name, 0) + count
+        
         return {
             **self.error_stats,
+            'error_types': error_types,
             'sentry_enabled': self.sentry_enabled,
             'error_callbacks_count': len(self.error_callbacks),
             'timestamp': datetime.utcnow().isoformat()
@@ -282,9 +336,13 @@ def get_error_tracker() -> ErrorTracker:
 
 def init_error_tracking(app: Flask) -> ErrorTracker:
     """Initialize error tracking with Flask app"""
-    global _error_tracker
-    _error_tracker = ErrorTracker(app)
-    return _error_tracker
+    tracker = get_error_tracker()
+    tracker.init_app(app)
+    return tracker
+
+
+# Module-level tracker for callers that import it directly
+error_tracker = get_error_tracker()
 
 
 def track_errors(operation: str = None):
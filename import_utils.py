@@ -4,6 +4,7 @@ Supports CSV and Excel file imports with validation
 """
 
 import pandas as pd
+import numpy as np
 import io
 import json
 from datetime import datetime
@@ -42,6 +43,55 @@ class DataImporter:
         except (ValueError, TypeError):
             return False, "Invalid coordinate format"
     
+    def validate_coordinates_batch(self, df):
+        """
+        Validate coordinates for every row of a DataFrame at once
+        
+        Vectorized equivalent of validate_coordinates for bulk imports.
+        
+        Returns:
+            Series aligned with df.index holding an error message, or None
+            for rows whose coordinates are valid
+        """
+        def to_float(column):
+            if column not in df.columns:
+                missing = np.zeros(len(df), dtype=bool)
+                return np.full(len(df), np.nan), missing, missing
+            raw = df[column]
+            present = raw.notna().to_numpy()
+            values = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=np.float64, copy=True)
+            # Present values that did not parse. float() decides between text
+            # like "abc" and values validate_coordinates accepts as numbers,
+            # such as a literal "nan", "1_0" or non-ASCII digits.
+            malformed = np.isnan(values) & present
+            for position in np.flatnonzero(malformed):
+                value = raw.iloc[position]
+                try:
+                    values[position] = float(value.strip() if isinstance(value, str) else value)
+                    malformed[position] = False
+                except (ValueError, TypeError):
+                    pass
+            return values, present & ~malformed, malformed
+        
+        lat, lat_present, lat_malformed = to_float('latitude')
+        lon, lon_present, lon_malformed = to_float('longitude')
+        
+        # Written as "not within range" so NaN values fail like the scalar check
+        errors = np.select(
+            [
+                lat_malformed | lon_malformed,
+                lat_present & ~((lat >= -90) & (lat <= 90)),
+                lon_present & ~((lon >= -180) & (lon <= 180)),
+            ],
+            [
+                "Invalid coordinate format",
+                "Latitude must be between -90 and 90",
+                "Longitude must be between -180 and 180",
+            ],
+            default=np.array(None, dtype=object),
+        )
+        return pd.Series(errors, index=df.index, dtype=object)
+    
     def validate_required_fields(self, data, required_fields):
         """Validate required fields are present"""
         missing_fields = []
@@ -95,6 +145,11 @@ class PollingPlaceImporter(DataImporter):
     def process_dataframe(self, df):
         """Process DataFrame and import records"""
         try:
+            # Validate all coordinates up front instead of row by row
+            coord_errors = None
+            if 'latitude' in df.columns or 'longitude' in df.columns:
+                coord_errors = self.validate_coordinates_batch(df)
+            
             for index, row in df.iterrows():
                 try:
                     # Convert row to dict, handling NaN values
@@ -113,13 +168,9 @@ class PollingPlaceImporter(DataImporter):
                         continue
                     
                     # Validate coordinates
-                    if 'latitude' in data or 'longitude' in data:
-                        coord_valid, coord_error = self.validate_coordinates(
-                            data.get('latitude'), data.get('longitude')
-                        )
-                        if not coord_valid:
-                            self.errors.append(f"Row {index + 1}: {coord_error}")
-                            continue
+                    if coord_errors is not None and coord_errors[index] is not None:
+                        self.errors.append(f"Row {index + 1}: {coord_errors[index]}")
+                        continue
                     
                     # Check if record exists
                     existing = PollingPlace.query.get(data['id'])
@@ -6,7 +6,8 @@ It's useful for testing, demonstrations, and development purposes.
 """
 
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 from plugins.base_plugin import BasePlugin
 
 
@@ -39,6 +40,14 @@ class DummyPlugin(BasePlugin):
         'view', 'side', 'ridge', 'valley', 'springs'
     ]
 
+    # Continental US bounds for fake coordinates, as (latitude, longitude)
+    COORDINATE_LOW = (24.5, -125.0)
+    COORDINATE_HIGH = (49.4, -66.0)
+
+    # Location types and how often each occurs; most are election day locations
+    FAKE_LOCATION_TYPES = ['drop box', 'early voting', 'election day']
+    FAKE_LOCATION_TYPE_WEIGHTS = [0.05, 0.15, 0.80]
+
     # US State codes and names
     STATES = {
         'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
@@ -56,6 +65,21 @@ class DummyPlugin(BasePlugin):
         'WI': 'Wisconsin', 'WY': 'Wyoming'
     }
 
+    def __init__(self, app, db):
+        super().__init__(app, db)
+        self._rng = np.random.default_rng()
+
+    def seed(self, seed: int) -> None:
+        """
+        Seed the random sources used for fake data so that the next
+        generation run is reproducible
+
+        Args:
+            seed: Seed for both the random module and the plugin's numpy generator
+        """
+        random.seed(seed)
+        self._rng = np.random.default_rng(seed)
+
     @property
     def name(self) -> str:
         return 'dummy'
@@ -86,10 +110,21 @@ class DummyPlugin(BasePlugin):
         Latitude: 24.5° to 49.4° (continental US)
         Longitude: -125° to -66° (continental US)
         """
-        lat = round(random.uniform(24.5, 49.4), 6)
-        lng = round(random.uniform(-125.0, -66.0), 6)
+        lat = round(random.uniform(self.COORDINATE_LOW[0], self.COORDINATE_HIGH[0]), 6)
+        lng = round(random.uniform(self.COORDINATE_LOW[1], self.COORDINATE_HIGH[1]), 6)
         return (lat, lng)
 
+    def generate_fake_coordinates_batch(self, n: int) -> np.ndarray:
+        """
+        Generate n fake coordinates in one draw, within the same bounds as
+        generate_fake_coordinates
+
+        Returns:
+            Array of shape (n, 2) holding latitude, longitude rows
+        """
+        coordinates = self._rng.uniform(self.COORDINATE_LOW, self.COORDINATE_HIGH, (n, 2))
+        return coordinates.round(6)
+
     def generate_fake_polling_hours(self) -> str:
         """Generate fake polling hours"""
         start_hour = random.choice([6, 7, 8])
@@ -98,17 +133,31 @@ class DummyPlugin(BasePlugin):
 
     def generate_fake_location_type(self) -> str:
         """Generate a fake location type with realistic distribution"""
-        # Most polling places are election day locations
-        weights = [0.05, 0.15, 0.80]  # drop box, early voting, election day
-        return random.choices(['drop box', 'early voting', 'election day'], weights=weights)[0]
+        return random.choices(self.FAKE_LOCATION_TYPES, weights=self.FAKE_LOCATION_TYPE_WEIGHTS)[0]
+
+    @classmethod
+    def sample_location_types(cls, n: int) -> List[str]:
+        """
+        Generate n fake location types in one draw, with the same
+        distribution as generate_fake_location_type
+        """
+        rng = np.random.default_rng()
+        types: List[str] = rng.choice(cls.FAKE_LOCATION_TYPES, size=n, p=cls.FAKE_LOCATION_TYPE_WEIGHTS).tolist()
+        return types
 
-    def generate_fake_location(self, state_code: str, location_id: int) -> Dict[str, Any]:
-        """Generate a single fake polling location"""
+    def generate_fake_location(self, state_code: str, location_id: int,
+                               coordinates: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+        """
+        Generate a single fake polling location
+
+        Uses the given (latitude, longitude) pair if provided, otherwise
+        generates one.
+        """
         location_type_name = random.choice(self.LOCATION_TYPES)
         location_name = f"{random.choice(['North', 'South', 'East', 'West', 'Central'])} {location_type_name}"
         city = self.generate_fake_city()
         address = self.generate_fake_address()
-        lat, lng = self.generate_fake_coordinates()
+        lat, lng = coordinates if coordinates is not None else self.generate_fake_coordinates()
         zip_code = f"{random.randint(10000, 99999)}"
 
         # Add some variety to the data
@@ -164,12 +213,14 @@ class DummyPlugin(BasePlugin):
         """
         polling_places = []
 
-        for state_code in self.STATES.keys():
-            # Generate between 100 and 120 locations per state
-            num_locations = random.randint(100, 120)
+        # Generate between 100 and 120 locations per state, drawing the
+        # coordinates for every location in a single batch
+        location_counts = {state_code: random.randint(100, 120) for state_code in self.STATES}
+        coordinates = iter(self.generate_fake_coordinates_batch(sum(location_counts.values())).tolist())
 
+        for state_code, num_locations in location_counts.items():
             for i in range(num_locations):
-                location = self.generate_fake_location(state_code, i + 1)
+                location = self.generate_fake_location(state_code, i + 1, tuple(next(coordinates)))
 
                 # Validate the data
                 if self.validate_polling_place_data(location):
@@ -16,11 +16,14 @@ import hashlib
 import secrets
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
-from flask import request, g, current_app
+from functools import wraps
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+from flask import request, g, current_app, has_request_context
 from werkzeug.security import check_password_hash
 import bleach
 
+from validators import EMAIL_PATTERN
+
 # Security logger
 security_logger = logging.getLogger('security')
 
@@ -37,7 +40,8 @@ PATTERNS = {
     'zip_code': re.compile(r'^\d{5}(-\d{4})?$'),
     'latitude': re.compile(r'^-?90?\d*\.\d+$'),
     'longitude': re.compile(r'^-?180?\d*\.\d+$'),
-    'email': re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'),
+    # Shared with validators.py so the two email checks cannot drift apart
+    'email': EMAIL_PATTERN,
     'api_key_name': re.compile(r'^[a-zA-Z0-9\s\-_]{1,255}$'),
     'plugin_name': re.compile(r'^[a-zA-Z0-9_\-]{1,50}$'),
     'election_id': re.compile(r'^\d+$'),
@@ -203,8 +207,14 @@ class SecurityValidator:
         return latitude, longitude
     
     @staticmethod
-    def validate_sort_column(column: str, allowed_columns: List[str]) -> str:
-        """Validate sort column against allowed list"""
+    def validate_sort_column(column: str, allowed_columns: Union[List[str], FrozenSet[str]]) -> str:
+        """
+        Validate sort column against allowed list
+        
+        Endpoints should define their allowed columns once as a module-level
+        frozenset for constant-time lookups; a plain list is scanned directly,
+        which is cheaper than converting it for a single check.
+        """
         if not column:
             return "id"  # default
         
@@ -278,10 +288,14 @@ class SecurityValidator:
             event_type: Type of security event
             severity: Severity level (low, medium, high, critical)
         """
-        client_ip = getattr(request, 'remote_addr', 'unknown')
-        user_agent = getattr(request, 'user_agent', {}).get('string', 'unknown')
-        endpoint = getattr(request, 'endpoint', 'unknown')
-        method = getattr(request, 'method', 'unknown')
+        in_request = has_request_context()
+        if in_request:
+            client_ip = request.remote_addr
+            user_agent = request.user_agent.string or 'unknown'
+            endpoint = request.endpoint
+            method = request.method
+        else:
+            client_ip = user_agent = endpoint = method = 'unknown'
         
         log_data = {
             'timestamp': datetime.utcnow().isoformat(),
@@ -298,9 +312,10 @@ class SecurityValidator:
         security_logger.warning(f"SECURITY_EVENT: {event_type} - {message} - IP: {client_ip} - Endpoint: {endpoint}")
         
         # Store in application context for potential response
-        if not hasattr(g, 'security_events'):
-            g.security_events = []
-        g.security_events.append(log_data)
+        if in_request:
+            if not hasattr(g, 'security_events'):
+                g.security_events = []
+            g.security_events.append(log_data)
     
     @staticmethod
     def validate_api_request_data(data: Dict[str, Any], required_fields: List[str] = None, 
@@ -439,18 +454,22 @@ def validate_json_input(required_fields: List[str] = None, optional_fields: Dict
         optional_fields: Dictionary of optional fields with default values
     """
     def decorator(f):
-        from functools import wraps
-        
+        # Validator/logger are bound as defaults so each call resolves them
+        # as locals rather than through module globals
         @wraps(f)
-        def decorated_function(*args, **kwargs):
+        def decorated_function(*args, _validate=SecurityValidator.validate_api_request_data,
+                               _log=SecurityValidator.log_security_event, **kwargs):
             try:
-                data = request.get_json()
+                data = request.get_json(silent=True)
                 if data is None:
+                    # A body that is present but not JSON is still rejected;
+                    # only an empty body counts as no input
+                    if request.get_data(cache=True):
+                        _log("JSON validation failed: body is not valid JSON", "validation_error")
+                        return {'error': 'Invalid request format'}, 400
                     data = {}
                 
-                validated_data = SecurityValidator.validate_api_request_data(
-                    data, required_fields, optional_fields
-                )
+                validated_data = _validate(data, required_fields, optional_fields)
                 
                 # Store validated data in request context
                 request.validated_data = validated_data
@@ -458,10 +477,10 @@ def validate_json_input(required_fields: List[str] = None, optional_fields: Dict
                 return f(*args, **kwargs)
                 
             except ValueError as e:
-                SecurityValidator.log_security_event(f"JSON validation failed: {str(e)}", "validation_error")
+                _log(f"JSON validation failed: {str(e)}", "validation_error")
                 return {'error': str(e)}, 400
             except Exception as e:
-                SecurityValidator.log_security_event(f"Unexpected validation error: {str(e)}", "system_error")
+                _log(f"Unexpected validation error: {str(e)}", "system_error")
                 return {'error': 'Invalid request format'}, 400
         
         return decorated_function
@@ -477,19 +496,17 @@ def log_security_event(event_type: str, message: str, severity: str = "medium"):
         severity: Severity level
     """
     def decorator(f):
-        from functools import wraps
-        
         @wraps(f)
-        def decorated_function(*args, **kwargs):
+        def decorated_function(*args, _log=SecurityValidator.log_security_event, **kwargs):
             # Log before processing
-            SecurityValidator.log_security_event(message, event_type, severity)
+            _log(message, event_type, severity)
             
             try:
                 result = f(*args, **kwargs)
                 
                 # Log successful completion for sensitive operations
                 if event_type in ['api_key_auth', 'admin_login', 'data_modification']:
-                    SecurityValidator.log_security_event(
+                    _log(
                         f"{message} - SUCCESS", 
                         f"{event_type}_success", 
                         "low"
@@ -499,7 +516,7 @@ def log_security_event(event_type: str, message: str, severity: str = "medium"):
                 
             except Exception as e:
                 # Log failed operation
-                SecurityValidator.log_security_event(
+                _log(
                     f"{message} - FAILED: {str(e)}", 
                     f"{event_type}_failure", 
                     "high"
@@ -5,17 +5,167 @@ This module provides comprehensive structured logging with JSON formatting,
 correlation IDs, request tracking, and performance monitoring.
 """
 
+import atexit
+import copy
 import json
 import logging
+import os
+import queue
+import threading
 import time
 import uuid
-import traceback
-from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Callable, Dict, Optional, Union
 from functools import wraps
-from flask import Flask, request, g
+from flask import Flask, request, g, has_request_context
 from pythonjsonlogger import jsonlogger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# LogRecord attributes that cannot be passed through ``extra``
+_RESERVED_RECORD_ATTRS = frozenset(
+    logging.LogRecord('', logging.INFO, '', 0, '', None, None).__dict__
+) | {'message', 'asctime'}
+
+
+if ORJSON_AVAILABLE:
+    # Datetimes and dataclasses fall through to str() so lines look the
+    # same whichever encoder is installed
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    
+    def _orjson_encode(value: Any) -> str:
+        """Encode a value to a JSON string with orjson"""
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS).decode('utf-8')
+
+
+# Encoder for values substituted into the pre-rendered log line templates
+_ENCODER: Callable[[Any], str]
+if ORJSON_AVAILABLE:
+    _ENCODER = _orjson_encode
+else:
+    _ENCODER = json.JSONEncoder(default=str, separators=(',', ':')).encode
+
+# Request start/end lines are emitted on every request with a fixed shape,
+# so they are rendered from templates instead of through the JSON formatter.
+# Every slot takes a JSON-encoded value; the leading asctime slot is filled
+# by StructuredLogger.log_template with the formatter's own timestamp.
+_REQUEST_START_TEMPLATE = (
+    '{"asctime":%s,"name":%s,"levelname":"INFO","message":%s,"event_type":"request_start",'
+    '"service":"csc-pollingplace-api","version":%s,"request_id":%s,"method":%s,"url":%s,'
+    '"user_agent":%s,"remote_addr":%s,"path":%s}'
+)
+_REQUEST_END_TEMPLATE = (
+    '{"asctime":%s,"name":%s,"levelname":"INFO","message":%s,"event_type":"http_request",'
+    '"service":"csc-pollingplace-api","version":%s,"request_id":%s,"method":%s,"url":%s,'
+    '"user_agent":%s,"remote_addr":%s,"path":%s,"status_code":%s,"duration_ms":%s,'
+    '"response_size":%s}'
+)
+
+
+class _StructuredJsonFormatter(jsonlogger.JsonFormatter):
+    """JSON formatter that passes pre-rendered template lines through as-is"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        if getattr(record, 'preformatted', False):
+            return record.getMessage()
+        return super().format(record)
+    
+    def jsonify_log_record(self, log_record) -> str:
+        if ORJSON_AVAILABLE:
+            try:
+                return _orjson_encode(log_record)
+            except orjson.JSONEncodeError:
+                # orjson rejects a few values the stdlib accepts, such as
+                # integers wider than 64 bits
+                pass
+        return super().jsonify_log_record(log_record)
+
+
+# Shared JSON formatter for every structured log handler
+JSON_FORMATTER = _StructuredJsonFormatter(
+    fmt='%(asctime)s %(name)s %(levelname)s %(message)s %(filename)s %(lineno)d',
+    datefmt='%Y-%m-%dT%H:%M:%S',
+    json_default=str
+)
+
+# Loggers only enqueue records; a single background listener owns the
+# console/file handlers so request threads never block on log I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_listener: Optional[QueueListener] = None
+_queue_listener_lock = threading.Lock()
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """Queue handler that keeps records structured for the JSON formatter"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The default prepare() flattens the record into a pre-formatted
+        # string; only resolve the message and render the traceback here
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            exc_text = JSON_FORMATTER.formatException(record.exc_info)
+            # Only a list of lines when the formatter has exc_info_as_array set
+            record.exc_text = exc_text if isinstance(exc_text, str) else '\n'.join(exc_text)
+            record.exc_info = None
+        return record
+
+
+def _start_queue_listener() -> QueueListener:
+    """Create the log output handlers and start the listener, once per process"""
+    global _queue_listener
+    
+    with _queue_listener_lock:
+        if _queue_listener is None:
+            # The file handlers open their files here, so the directory
+            # has to exist before the first record reaches the listener
+            os.makedirs('logs', exist_ok=True)
+            
+            # Console handler
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(JSON_FORMATTER)
+            
+            # File handler for errors
+            error_handler = RotatingFileHandler(
+                'logs/error.log', maxBytes=10 * 1024 * 1024, backupCount=5
+            )
+            error_handler.setLevel(logging.ERROR)
+            error_handler.setFormatter(JSON_FORMATTER)
+            
+            # File handler for all logs
+            file_handler = RotatingFileHandler(
+                'logs/app.log', maxBytes=10 * 1024 * 1024, backupCount=5
+            )
+            file_handler.setFormatter(JSON_FORMATTER)
+            
+            _queue_listener = QueueListener(
+                _log_queue, console_handler, error_handler, file_handler,
+                respect_handler_level=True
+            )
+            _queue_listener.start()
+            atexit.register(_queue_listener.stop)
+    
+    return _queue_listener
+
+
+def _request_log_context() -> Dict[str, Any]:
+    """Read the request fields included in every log line of a request"""
+    return {
+        'request_id': g.get('request_id'),
+        'method': request.method,
+        'url': request.url,
+        'user_agent': request.user_agent.string or 'unknown',
+        'remote_addr': request.remote_addr or 'unknown'
+    }
+
 
 class StructuredLogger:
     """Structured logger with JSON formatting and correlation tracking"""
@@ -24,6 +174,7 @@ class StructuredLogger:
         self.name = name
         self.logger = logging.getLogger(name)
         self.app = app
+        self.version = getattr(app, 'version', '1.0.0') if app else '1.0.0'
         self._setup_logger()
     
     def _setup_logger(self):
@@ -32,50 +183,30 @@ class StructuredLogger:
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
         
-        # Create JSON formatter
-        formatter = jsonlogger.JsonFormatter(
-            fmt='%(asctime)s %(name)s %(levelname)s %(message)s %(filename)s %(lineno)d',
-            datefmt='%Y-%m-%dT%H:%M:%S'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
-        # File handler for errors
-        error_handler = logging.FileHandler('logs/error.log')
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(formatter)
-        self.logger.addHandler(error_handler)
-        
-        # File handler for all logs
-        file_handler = logging.FileHandler('logs/app.log')
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        # Records are handed to the background listener's handlers
+        _start_queue_listener()
+        self.logger.addHandler(_StructuredQueueHandler(_log_queue))
         
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = False
     
     def _get_context(self) -> Dict[str, Any]:
         """Get request context for logging"""
+        # No timestamp here: the formatter already stamps asctime
         context = {
-            'timestamp': datetime.utcnow().isoformat(),
             'service': 'csc-pollingplace-api',
-            'version': getattr(self.app, 'version', '1.0.0') if self.app else '1.0.0'
+            'version': self.version
         }
         
-        # Add request context if available (safely check for request context)
+        # Add request context if available; the request fields are built
+        # once per request and cached on g
         try:
-            if request and hasattr(request, 'method'):
-                context.update({
-                    'request_id': getattr(g, 'request_id', None),
-                    'method': request.method,
-                    'url': request.url,
-                    'user_agent': getattr(request, 'user_agent', {}).get('string', 'unknown'),
-                    'remote_addr': getattr(request, 'remote_addr', 'unknown'),
-                    'api_key': getattr(request, 'api_key', None)
-                })
+            if has_request_context():
+                log_ctx = g.get('_log_ctx')
+                if log_ctx is None:
+                    log_ctx = g._log_ctx = _request_log_context()
+                context.update(log_ctx)
+                context['api_key'] = getattr(request, 'api_key', None)
         except (RuntimeError, AttributeError):
             # Working outside of request context - skip request-specific fields
             pass
@@ -92,20 +223,42 @@ class StructuredLogger:
     
     def _log(self, level: int, message: str, **kwargs):
         """Log with structured context"""
+        # Skip building context for filtered levels
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        exc_info = kwargs.pop('exc_info', None)
         context = self._get_context()
         context.update(kwargs)
         
-        # Add exception info if available
-        if 'exc_info' in kwargs:
-            context['exception'] = traceback.format_exception(*kwargs['exc_info'])
-        
-        log_entry = {
-            'level': logging.getLevelName(level),
-            'message': message,
-            **context
+        # Context goes to the JSON formatter as record attributes so each
+        # line is serialized exactly once; clashing keys get a suffix
+        extra = {
+            (f'{key}_' if key in _RESERVED_RECORD_ATTRS else key): value
+            for key, value in context.items()
         }
         
-        self.logger.log(level, json.dumps(log_entry, default=str))
+        self.logger.log(level, message, exc_info=exc_info, extra=extra)
+    
+    def log_template(self, level: int, template: str, *values):
+        """
+        Log a pre-rendered JSON line, skipping context building and the JSON formatter
+        
+        Args:
+            level: Logging level
+            template: JSON line with a leading asctime slot and one %s slot per value
+            values: Values for the remaining slots, each JSON-encoded before substitution
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        record = self.logger.makeRecord(
+            self.name, level, __file__, 0, template, (), None, extra={'preformatted': True}
+        )
+        # Stamp the line the same way the JSON formatter stamps asctime
+        asctime = JSON_FORMATTER.formatTime(record, JSON_FORMATTER.datefmt)
+        record.msg = template % (_ENCODER(asctime), *(_ENCODER(value) for value in values))
+        self.logger.handle(record)
     
     def debug(self, message: str, **kwargs):
         """Log debug message"""
@@ -134,6 +287,10 @@ class StructuredLogger:
     
     def log_request(self, duration: Optional[float] = None, status_code: Optional[int] = None, **kwargs):
         """Log HTTP request"""
+        is_error = bool(status_code and status_code >= 400)
+        if not self.logger.isEnabledFor(logging.ERROR if is_error else logging.INFO):
+            return
+        
         context = {
             'event_type': 'http_request',
             'duration_ms': duration * 1000 if duration else None,
@@ -145,13 +302,16 @@ class StructuredLogger:
         if status_code:
             message += f" - {status_code}"
         
-        if status_code and status_code >= 400:
+        if is_error:
             self.error(message, **context)
         else:
             self.info(message, **context)
     
     def log_performance(self, operation: str, duration: float, **kwargs):
         """Log performance metrics"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         context = {
             'event_type': 'performance',
             'operation': operation,
@@ -163,6 +323,9 @@ class StructuredLogger:
     
     def log_business_event(self, event_type: str, **kwargs):
         """Log business events"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         context = {
             'event_type': 'business',
             'business_event': event_type
@@ -173,6 +336,10 @@ class StructuredLogger:
     
     def log_security_event(self, event_type: str, severity: str = 'medium', **kwargs):
         """Log security events"""
+        is_severe = severity in ('high', 'critical')
+        if not self.logger.isEnabledFor(logging.WARNING if is_severe else logging.INFO):
+            return
+        
         context = {
             'event_type': 'security',
             'security_event': event_type,
@@ -180,12 +347,32 @@ class StructuredLogger:
         }
         context.update(kwargs)
         
-        if severity in ['high', 'critical']:
+        if is_severe:
             self.warning(f"Security Event: {event_type}", **context)
         else:
             self.info(f"Security Event: {event_type}", **context)
 
 
+def _response_size(response) -> Optional[int]:
+    """
+    Get the response body size without reading a streamed body
+    
+    Args:
+        response: Flask response object
+        
+    Returns:
+        Size in bytes, or None for streamed responses
+    """
+    size = getattr(response, 'content_length', None)
+    if size is None and getattr(response, 'is_sequence', False):
+        size = response.calculate_content_length()
+    return size
+
+
+# Endpoints that get no request id, timing or request logs
+TRACKING_SKIP_ENDPOINTS = frozenset({'static'})
+
+
 class RequestTracker:
     """Request tracking middleware for correlation IDs and performance"""
     
@@ -202,16 +389,29 @@ class RequestTracker:
     
     def _before_request(self):
         """Setup request context"""
+        # Static assets are not tracked, which also skips the uuid4() below
+        if request.endpoint in TRACKING_SKIP_ENDPOINTS:
+            return
+        
         # Generate correlation ID
         g.request_id = request.headers.get('X-Request-ID') or str(uuid.uuid4())
         g.start_time = time.time()
+        log_ctx = g._log_ctx = _request_log_context()
         
         # Log request start
         logger = get_logger()
-        logger.info(
+        logger.log_template(
+            logging.INFO,
+            _REQUEST_START_TEMPLATE,
+            logger.name,
             f"Request started: {request.method} {request.path}",
-            event_type='request_start',
-            request_id=g.request_id
+            logger.version,
+            g.request_id,
+            request.method,
+            log_ctx['url'],
+            log_ctx['user_agent'],
+            log_ctx['remote_addr'],
+            request.path
         )
     
     def _after_request(self, response):
@@ -219,12 +419,34 @@ class RequestTracker:
         if hasattr(g, 'start_time'):
             duration = time.time() - g.start_time
             
+            response_size = _response_size(response)
+            
             logger = get_logger()
-            logger.log_request(
-                duration=duration,
-                status_code=response.status_code,
-                response_size=len(response.get_data()) if hasattr(response, 'get_data') else None
-            )
+            if response.status_code >= 400:
+                # Failures keep the full structured context
+                logger.log_request(
+                    duration=duration,
+                    status_code=response.status_code,
+                    response_size=response_size
+                )
+            else:
+                log_ctx = g._log_ctx
+                logger.log_template(
+                    logging.INFO,
+                    _REQUEST_END_TEMPLATE,
+                    logger.name,
+                    f"{request.method} {request.path} - {response.status_code}",
+                    logger.version,
+                    g.request_id,
+                    request.method,
+                    log_ctx['url'],
+                    log_ctx['user_agent'],
+                    log_ctx['remote_addr'],
+                    request.path,
+                    response.status_code,
+                    duration * 1000,
+                    response_size
+                )
             
             # Add correlation ID to response
             response.headers['X-Request-ID'] = g.request_id
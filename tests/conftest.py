@@ -0,0 +1,162 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import os
+import sys
+import tempfile
+from typing import Dict, Optional, cast
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Make the project root importable once for every test module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.py creates its engine, tables and default admin user at import time.
+# Give each pytest-xdist worker its own SQLite file so parallel workers never
+# share (or clobber) the development database. This is assigned rather than
+# defaulted because xdist workers inherit the controller's environment.
+_WORKER_ID = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+_TEST_SQLITE_PATH = os.path.join(
+    tempfile.gettempdir(), f'pollingplaces-test-{os.getpid()}-{_WORKER_ID}.db'
+)
+os.environ['SQLITE_PATH'] = _TEST_SQLITE_PATH
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless --benchmark-only or --benchmark-enable asks for them."""
+    if not config.pluginmanager.hasplugin('benchmark'):
+        return
+    if config.getoption('benchmark_only') or config.getoption('benchmark_enable'):
+        return
+    
+    skip_benchmark = pytest.mark.skip(reason='benchmarks run with --benchmark-only or --benchmark-enable')
+    for item in items:
+        if 'benchmark' in getattr(item, 'fixturenames', ()):
+            item.add_marker(skip_benchmark)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove this worker's SQLite file once the session is over."""
+    if os.path.exists(_TEST_SQLITE_PATH):
+        os.remove(_TEST_SQLITE_PATH)
+
+
+# Named shared-cache in-memory SQLite on one static connection: every session
+# and thread sees the same database, and the schema is created exactly once.
+# Each pytest-xdist worker gets its own named database.
+TEST_DATABASE_URI = f'sqlite:///file:testdb-{_WORKER_ID}?mode=memory&cache=shared&uri=true'
+
+
+def _emit_sqlite_begin(engine):
+    """Let SAVEPOINTs nest inside a real outer transaction on pysqlite.
+    
+    pysqlite defers BEGIN until the first DML statement, so a savepoint would
+    start the transaction itself and RELEASE SAVEPOINT would commit it. Turn
+    off its implicit transactions and emit BEGIN ourselves, as the SQLAlchemy
+    SQLite dialect docs recommend.
+    
+    Args:
+        engine: SQLite engine that has not opened a connection yet
+    """
+    @event.listens_for(engine, 'connect')
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+
+@pytest.fixture(scope='session')
+def app_ctx():
+    """Configure the app for testing and create its schema once per session.
+    
+    app.py is imported here rather than at module level so that SQLITE_PATH
+    is already set when it builds its engine.
+    """
+    from app import app
+    from models import db
+    
+    # TESTING already propagates exceptions, and app.py turns off modification
+    # tracking; the JSON provider still sorts every response's keys by default
+    app.config['TESTING'] = True
+    # Tests that check last_used_at turn the write back on themselves
+    app.config['SKIP_LAST_USED_UPDATE'] = True
+    json_provider = app.json
+    assert isinstance(json_provider, DefaultJSONProvider)
+    sort_keys = json_provider.sort_keys
+    json_provider.sort_keys = False
+    ctx = app.app_context()
+    ctx.push()
+    
+    # Flask-SQLAlchemy built its engine when app.py was imported, so the test
+    # database is swapped in rather than configured
+    engine = create_engine(
+        TEST_DATABASE_URI,
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False, 'uri': True}
+    )
+    _emit_sqlite_begin(engine)
+    db.session.remove()
+    # Typed as a read-only Mapping, but it is the extension's own dict
+    engines = cast(Dict[Optional[str], Engine], db.engines)
+    app_engine = engines[None]
+    engines[None] = engine
+    db.create_all()
+    
+    yield app
+    
+    db.session.remove()
+    db.drop_all()
+    engines[None] = app_engine
+    engine.dispose()
+    ctx.pop()
+    json_provider.sort_keys = sort_keys
+    app.config['SKIP_LAST_USED_UPDATE'] = False
+
+
+@pytest.fixture(scope='session')
+def client(app_ctx):
+    """Test client shared by the whole session; tests authenticate by header."""
+    return app_ctx.test_client()
+
+
+@pytest.fixture(scope='class')
+def class_client(request, client):
+    """Expose the shared test client to unittest classes as ``self.client``."""
+    request.cls.client = client
+
+
+@pytest.fixture
+def db_session(app_ctx):
+    """Run the test inside a transaction that is rolled back afterwards.
+    
+    Commits made by the app only release a savepoint inside the outer
+    transaction, so nothing a test writes outlives it.
+    """
+    from models import db
+    
+    assert db.engine.url == make_url(TEST_DATABASE_URI)
+    connection = db.engine.connect()
+    trans = connection.begin()
+    app_session = db.session
+    # A plain Session, since Flask-SQLAlchemy's would pick the engine rather
+    # than this connection for every mapped query
+    session_factory: sessionmaker = sessionmaker(
+        bind=connection,
+        join_transaction_mode='create_savepoint'
+    )
+    db.session = scoped_session(session_factory)
+    
+    yield db.session
+    
+    db.session.remove()
+    db.session = app_session
+    trans.rollback()
+    connection.close()
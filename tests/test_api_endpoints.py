@@ -9,64 +9,132 @@ Includes unit tests, integration tests, and error scenario tests for:
 - Error handling and authentication
 """
 
+import importlib.util
+from contextlib import ExitStack
 import pytest
 import unittest
 from unittest.mock import Mock, patch, MagicMock, call
-import json
+import orjson
 import tempfile
 import os
+import sys
 from io import BytesIO
+from types import SimpleNamespace
+from typing import Any
 
-# Import Flask app and related modules
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# A direct run puts tests/ rather than the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Import Flask app and related modules
+from flask.testing import FlaskClient
 from app import app
 from models import PollingPlace, Precinct, Election, APIKey, db
 
+# orjson decodes response bytes directly, without a separate UTF-8 decode
+_loads = orjson.loads
 
-class TestPluginAPIEndpoints(unittest.TestCase):
-    """Unit tests for plugin-related API endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
+def _loads_response(response):
+    """Decode a test response body once and cache it on the response.
+    
+    Args:
+        response: Flask test client response
+        
+    Returns:
+        Decoded JSON body
+    """
+    try:
+        return response._orjson_cache
+    except AttributeError:
+        response._orjson_cache = _loads(response.data)
+        return response._orjson_cache
+
+# Fixed API key for the test database; it only has to be unique per table
+API_KEY = "test-api-key-fixed-value-not-secret"
+
+# Built once and shared; the test client copies request headers
+_AUTH_HEADERS = {'X-API-Key': API_KEY}
+
+# Upload payload shared by the file upload tests; each test wraps it in its
+# own BytesIO since the test client consumes the stream
+_UPLOAD_BYTES = b'test,csv,data\n1,2,3\n4,5,6\n'
+_INVALID_UPLOAD_BYTES = b'invalid,data'
+
+# Canned plugin responses shared by reference across tests; the endpoints
+# only serialize them, so nothing mutates them
+_OHIO_STATUS = {
+    'name': 'ohio',
+    'state_code': 'OH',
+    'description': 'Ohio polling place data from state CSV',
+    'last_sync': '2024-01-15T10:30:00Z',
+    'total_polling_places': 1500,
+    'total_precincts': 2000,
+    'status': 'healthy'
+}
+_SYNC_RESULT = {'success': True, 'added': 10, 'updated': 5, 'errors': 0}
+
+
+@pytest.mark.usefixtures('class_client', 'db_session')
+class _APITestBase(unittest.TestCase):
+    """Shared API key and plugin_manager patch for the API tests.
+    
+    The app context, schema and per-test rollback come from the conftest
+    fixtures, so only the API key seeded here outlives a test.
+    """
+
+    # Set by the class_client fixture and setUpClass
+    client: FlaskClient
+    mock_pm: MagicMock
+    _patcher: Any
+
+    @classmethod
+    def setUpClass(cls):
+        """Seed the API key and patch plugin_manager once for the whole class."""
+        # Read at request time by query_optimization's monitoring helpers
+        app.config['SQLALCHEMY_RECORD_QUERIES'] = False
         
         # Create a test API key for authentication
-        import secrets
         test_api_key = APIKey()
-        test_api_key.key = secrets.token_urlsafe(32)
+        test_api_key.key = API_KEY
         test_api_key.name = "Test API Key"
         test_api_key.is_active = True
         db.session.add(test_api_key)
         db.session.commit()
+        db.session.remove()
         
-        self.api_key = test_api_key.key
+        # One plugin_manager mock for the class, reset before each test
+        cls._patcher = patch('app.plugin_manager')
+        cls.mock_pm = cls._patcher.start()
 
-    def tearDown(self):
-        """Clean up test fixtures."""
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the patch and remove the seeded API key."""
+        cls._patcher.stop()
+        db.session.execute(APIKey.__table__.delete().where(APIKey.key == API_KEY))
+        db.session.commit()
         db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
+
+    def setUp(self):
+        """Give each test a freshly reset plugin_manager mock."""
+        self.mock_pm.reset_mock(return_value=True, side_effect=True)
     
     def get_authenticated_headers(self):
         """Get headers with API key authentication."""
-        return {'X-API-Key': self.api_key}
+        return _AUTH_HEADERS
+
+
+class TestPluginAPIEndpoints(_APITestBase):
+    """Unit tests for plugin-related API endpoints."""
+
+    # Request bodies serialized once for the class
+    _EMPTY_BODY = orjson.dumps({})
+    _SYNC_BODY = orjson.dumps({'election_id': 123})
 
-    @patch('app.plugin_manager')
-    def test_list_plugins_endpoint(self, mock_plugin_manager):
+    def test_list_plugins_endpoint(self):
         """Test plugin listing endpoint."""
         # Mock plugin manager response
-        mock_plugin_manager.list_plugins.return_value = [
+        self.mock_pm.list_plugins.return_value = [
             {
                 'name': 'ohio',
                 'state_code': 'OH',
@@ -84,78 +152,63 @@ class TestPluginAPIEndpoints(unittest.TestCase):
         response = self.client.get('/api/plugins', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertEqual(len(data['plugins']), 2)
         self.assertEqual(data['plugins'][0]['name'], 'ohio')
         self.assertEqual(data['plugins'][1]['name'], 'virginia')
 
-    @patch('app.plugin_manager')
-    def test_list_plugins_error(self, mock_plugin_manager):
+    def test_list_plugins_error(self):
         """Test plugin listing endpoint with error."""
-        mock_plugin_manager.list_plugins.side_effect = Exception("Plugin manager error")
+        self.mock_pm.list_plugins.side_effect = Exception("Plugin manager error")
 
         response = self.client.get('/api/plugins', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 500)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
-    @patch('app.plugin_manager')
-    def test_get_plugin_by_state_endpoint(self, mock_plugin_manager):
+    def test_get_plugin_by_state_endpoint(self):
         """Test getting plugin by state code."""
-        mock_plugin = Mock()
-        mock_plugin.name = 'ohio'
-        mock_plugin.state_code = 'OH'
-        mock_plugin.description = 'Ohio polling place data'
-        mock_plugin.get_status.return_value = {
-            'name': 'ohio',
-            'state_code': 'OH',
-            'description': 'Ohio polling place data'
-        }
-        mock_plugin_manager.get_plugin_by_state.return_value = mock_plugin
+        mock_plugin = SimpleNamespace(
+            name='ohio',
+            state_code='OH',
+            description='Ohio polling place data'
+        )
+        self.mock_pm.get_plugin_by_state.return_value = mock_plugin
 
         response = self.client.get('/api/plugins/state/OH', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertEqual(data['name'], 'ohio')
         self.assertEqual(data['state_code'], 'OH')
 
-    @patch('app.plugin_manager')
-    def test_get_plugin_by_state_not_found(self, mock_plugin_manager):
+    def test_get_plugin_by_state_not_found(self):
         """Test getting plugin by non-existent state code."""
-        mock_plugin_manager.get_plugin_by_state.side_effect = KeyError("No plugin found for state 'XX'")
+        self.mock_pm.get_plugin_by_state.side_effect = KeyError("No plugin found for state 'XX'")
 
         response = self.client.get('/api/plugins/state/XX', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 404)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
-    @patch('app.plugin_manager')
-    def test_sync_plugin_endpoint(self, mock_plugin_manager):
+    def test_sync_plugin_endpoint(self):
         """Test plugin synchronization endpoint."""
-        mock_plugin_manager.sync_plugin.return_value = {
-            'success': True,
-            'added': 10,
-            'updated': 5,
-            'errors': 0
-        }
+        self.mock_pm.sync_plugin.return_value = _SYNC_RESULT
 
         response = self.client.post('/api/plugins/ohio/sync', 
-                                 json={},
+                                 data=self._EMPTY_BODY,
+                                 content_type='application/json',
                                  headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertTrue(data['success'])
         self.assertEqual(data['added'], 10)
         self.assertEqual(data['updated'], 5)
 
-    @patch('app.plugin_manager')
-    def test_sync_plugin_with_election_id(self, mock_plugin_manager):
+    def test_sync_plugin_with_election_id(self):
         """Test plugin synchronization with election ID."""
-        mock_plugin_manager.sync_plugin.return_value = {
+        self.mock_pm.sync_plugin.return_value = {
             'success': True,
             'added': 8,
             'updated': 3,
@@ -163,31 +216,29 @@ class TestPluginAPIEndpoints(unittest.TestCase):
         }
 
         response = self.client.post('/api/plugins/ohio/sync', 
-                                 json={'election_id': 123},
+                                 data=self._SYNC_BODY,
                                  content_type='application/json',
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 200)
-        mock_plugin_manager.sync_plugin.assert_called_once_with('ohio', election_id=123)
+        self.mock_pm.sync_plugin.assert_called_once_with('ohio', election_id=123)
 
-    @patch('app.plugin_manager')
-    def test_sync_plugin_not_found(self, mock_plugin_manager):
+    def test_sync_plugin_not_found(self):
         """Test syncing non-existent plugin."""
-        mock_plugin_manager.get_plugin.return_value = None
-        mock_plugin_manager.sync_plugin.side_effect = KeyError("Plugin 'nonexistent' not found")
+        self.mock_pm.get_plugin.return_value = None
+        self.mock_pm.sync_plugin.side_effect = KeyError("Plugin 'nonexistent' not found")
 
         response = self.client.post('/api/plugins/nonexistent/sync', 
-                                 json={},
+                                 data=self._EMPTY_BODY,
+                                 content_type='application/json',
                                  headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 404)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
-    @patch('app.plugin_manager')
-    def test_sync_all_plugins_endpoint(self, mock_plugin_manager):
+    def test_sync_all_plugins_endpoint(self):
         """Test syncing all plugins endpoint."""
-        mock_plugin_manager.sync_all_plugins.return_value = {
+        self.mock_pm.sync_all_plugins.return_value = {
             'ohio': {'success': True, 'added': 10, 'updated': 5},
             'virginia': {'success': True, 'added': 15, 'updated': 8}
         }
@@ -195,16 +246,15 @@ class TestPluginAPIEndpoints(unittest.TestCase):
         response = self.client.post('/api/plugins/sync-all', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertIn('ohio', data)
         self.assertIn('virginia', data)
         self.assertTrue(data['ohio']['success'])
         self.assertTrue(data['virginia']['success'])
 
-    @patch('app.plugin_manager')
-    def test_sync_all_plugins_partial_failure(self, mock_plugin_manager):
+    def test_sync_all_plugins_partial_failure(self):
         """Test syncing all plugins with some failures."""
-        mock_plugin_manager.sync_all_plugins.return_value = {
+        self.mock_pm.sync_all_plugins.return_value = {
             'ohio': {'success': True, 'added': 10, 'updated': 5},
             'virginia': {'success': False, 'error': 'Network error', 'errors': 1}
         }
@@ -212,60 +262,23 @@ class TestPluginAPIEndpoints(unittest.TestCase):
         response = self.client.post('/api/plugins/sync-all', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 207)  # Multi-status
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertTrue(data['ohio']['success'])
         self.assertFalse(data['virginia']['success'])
 
 
-class TestFileUploadEndpoints(unittest.TestCase):
+class TestFileUploadEndpoints(_APITestBase):
     """Unit tests for file upload endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create a test API key for authentication
-        import secrets
-        test_api_key = APIKey()
-        test_api_key.key = secrets.token_urlsafe(32)
-        test_api_key.name = "Test API Key"
-        test_api_key.is_active = True
-        db.session.add(test_api_key)
-        db.session.commit()
-        
-        self.api_key = test_api_key.key
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-    
-    def get_authenticated_headers(self):
-        """Get headers with API key authentication."""
-        return {'X-API-Key': self.api_key}
-
-    @patch('app.plugin_manager')
-    def test_upload_file_success(self, mock_plugin_manager):
+    def test_upload_file_success(self):
         """Test successful file upload."""
-        mock_plugin = Mock()
-        mock_plugin.upload_file.return_value = {
+        mock_plugin = SimpleNamespace(upload_file=lambda path: {
             'success': True,
             'message': 'File uploaded successfully'
-        }
-        mock_plugin_manager.get_plugin.return_value = mock_plugin
+        })
+        self.mock_pm.get_plugin.return_value = mock_plugin
 
-        # Create a test file
-        test_data = b'test,csv,data\n1,2,3\n4,5,6\n'
-        test_file = (BytesIO(test_data), 'test.csv')
+        test_file = (BytesIO(_UPLOAD_BYTES), 'test.csv')
 
         response = self.client.post('/api/plugins/ohio/upload',
                                  data={'file': test_file},
@@ -273,12 +286,11 @@ class TestFileUploadEndpoints(unittest.TestCase):
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertTrue(data['success'])
         self.assertIn('message', data)
 
-    @patch('app.plugin_manager')
-    def test_upload_file_no_file(self, mock_plugin_manager):
+    def test_upload_file_no_file(self):
         """Test file upload without file."""
         response = self.client.post('/api/plugins/ohio/upload',
                                  data={},
@@ -286,16 +298,13 @@ class TestFileUploadEndpoints(unittest.TestCase):
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
-    @patch('app.plugin_manager')
-    def test_upload_file_plugin_not_found(self, mock_plugin_manager):
+    def test_upload_file_plugin_not_found(self):
         """Test file upload for non-existent plugin."""
-        mock_plugin_manager.get_plugin.return_value = None
+        self.mock_pm.get_plugin.return_value = None
 
-        test_data = b'test,data\n'
-        test_file = (BytesIO(test_data), 'test.csv')
+        test_file = (BytesIO(_UPLOAD_BYTES), 'test.csv')
 
         response = self.client.post('/api/plugins/nonexistent/upload',
                                  data={'file': test_file},
@@ -303,21 +312,17 @@ class TestFileUploadEndpoints(unittest.TestCase):
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 404)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
-    @patch('app.plugin_manager')
-    def test_upload_file_upload_error(self, mock_plugin_manager):
+    def test_upload_file_upload_error(self):
         """Test file upload with upload error."""
-        mock_plugin = Mock()
-        mock_plugin.upload_file.return_value = {
+        mock_plugin = SimpleNamespace(upload_file=lambda path: {
             'success': False,
             'message': 'Invalid file format'
-        }
-        mock_plugin_manager.get_plugin.return_value = mock_plugin
+        })
+        self.mock_pm.get_plugin.return_value = mock_plugin
 
-        test_data = b'invalid,data'
-        test_file = (BytesIO(test_data), 'test.csv')
+        test_file = (BytesIO(_INVALID_UPLOAD_BYTES), 'test.csv')
 
         response = self.client.post('/api/plugins/ohio/upload',
                                  data={'file': test_file},
@@ -325,52 +330,21 @@ class TestFileUploadEndpoints(unittest.TestCase):
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 200)  # Upload endpoint returns 200 even if plugin reports error
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertFalse(data['success'])
         self.assertIn('message', data)
 
 
-class TestElectionEndpoints(unittest.TestCase):
+class TestElectionEndpoints(_APITestBase):
     """Unit tests for election-related endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create a test API key for authentication
-        import secrets
-        test_api_key = APIKey()
-        test_api_key.key = secrets.token_urlsafe(32)
-        test_api_key.name = "Test API Key"
-        test_api_key.is_active = True
-        db.session.add(test_api_key)
-        db.session.commit()
-        
-        self.api_key = test_api_key.key
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-    
-    def get_authenticated_headers(self):
-        """Get headers with API key authentication."""
-        return {'X-API-Key': self.api_key}
+    # Request bodies serialized once for the class
+    _EMPTY_BODY = orjson.dumps({})
+    _SYNC_FILE_BODY = orjson.dumps({'url': 'http://example.com/election.xlsx'})
 
-    @patch('app.plugin_manager')
-    def test_get_available_elections(self, mock_plugin_manager):
+    def test_get_available_elections(self):
         """Test getting available elections."""
-        mock_plugin = Mock()
-        mock_plugin.get_available_elections.return_value = [
+        elections = [
             {
                 'election_date': '2024-11-05',
                 'election_name': '2024 General Election',
@@ -386,33 +360,30 @@ class TestElectionEndpoints(unittest.TestCase):
                 'is_recent': True
             }
         ]
-        mock_plugin_manager.get_plugin.return_value = mock_plugin
+        mock_plugin = SimpleNamespace(get_available_elections=lambda: elections)
+        self.mock_pm.get_plugin.return_value = mock_plugin
 
         response = self.client.get('/api/plugins/virginia/elections', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertEqual(len(data['elections']), 2)
         self.assertEqual(data['plugin'], 'virginia')
         self.assertEqual(data['elections'][0]['election_name'], '2024 General Election')
         self.assertEqual(data['elections'][1]['election_name'], '2024 Presidential Primary')
 
-    @patch('app.plugin_manager')
-    def test_get_available_elections_plugin_not_found(self, mock_plugin_manager):
+    def test_get_available_elections_plugin_not_found(self):
         """Test getting elections for non-existent plugin."""
-        mock_plugin_manager.get_plugin.return_value = None
+        self.mock_pm.get_plugin.return_value = None
 
         response = self.client.get('/api/plugins/nonexistent/elections', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 404)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
-    @patch('app.plugin_manager')
-    def test_sync_election_file(self, mock_plugin_manager):
+    def test_sync_election_file(self):
         """Test syncing specific election file."""
-        mock_plugin = Mock()
-        mock_plugin.sync_file.return_value = {
+        sync_result = {
             'success': True,
             'filename': '2024-General-Election.xlsx',
             'election': {
@@ -423,124 +394,71 @@ class TestElectionEndpoints(unittest.TestCase):
             'polling_places': {'added': 100, 'updated': 10},
             'precincts': {'added': 150, 'updated': 15}
         }
-        mock_plugin_manager.get_plugin.return_value = mock_plugin
+        mock_plugin = SimpleNamespace(sync_file=lambda url: sync_result)
+        self.mock_pm.get_plugin.return_value = mock_plugin
 
         response = self.client.post('/api/plugins/virginia/sync-file',
-                                 json={'url': 'http://example.com/election.xlsx'},
+                                 data=self._SYNC_FILE_BODY,
                                  content_type='application/json',
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertTrue(data['success'])
         self.assertEqual(data['filename'], '2024-General-Election.xlsx')
         self.assertEqual(data['polling_places']['added'], 100)
 
-    @patch('app.plugin_manager')
-    def test_sync_election_file_missing_url(self, mock_plugin_manager):
+    def test_sync_election_file_missing_url(self):
         """Test syncing election file without URL."""
         response = self.client.post('/api/plugins/virginia/sync-file',
-                                 json={},
+                                 data=self._EMPTY_BODY,
                                  content_type='application/json',
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
 
-class TestPluginStatusEndpoints(unittest.TestCase):
+class TestPluginStatusEndpoints(_APITestBase):
     """Unit tests for plugin status endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create a test API key for authentication
-        import secrets
-        test_api_key = APIKey()
-        test_api_key.key = secrets.token_urlsafe(32)
-        test_api_key.name = "Test API Key"
-        test_api_key.is_active = True
-        db.session.add(test_api_key)
-        db.session.commit()
-        
-        self.api_key = test_api_key.key
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-    
-    def get_authenticated_headers(self):
-        """Get headers with API key authentication."""
-        return {'X-API-Key': self.api_key}
-
-    @patch('app.plugin_manager')
-    def test_get_plugin_status(self, mock_plugin_manager):
+    def test_get_plugin_status(self):
         """Test getting plugin status."""
-        mock_plugin = Mock()
-        mock_plugin.get_status.return_value = {
-            'name': 'ohio',
-            'state_code': 'OH',
-            'description': 'Ohio polling place data from state CSV',
-            'last_sync': '2024-01-15T10:30:00Z',
-            'total_polling_places': 1500,
-            'total_precincts': 2000,
-            'status': 'healthy'
-        }
-        mock_plugin_manager.get_plugin.return_value = mock_plugin
+        mock_plugin = SimpleNamespace(get_status=lambda: _OHIO_STATUS)
+        self.mock_pm.get_plugin.return_value = mock_plugin
 
         response = self.client.get('/api/plugins/ohio/status', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertEqual(data['name'], 'ohio')
         self.assertEqual(data['state_code'], 'OH')
         self.assertEqual(data['status'], 'healthy')
 
-    @patch('app.plugin_manager')
-    def test_get_plugin_status_not_found(self, mock_plugin_manager):
+    def test_get_plugin_status_not_found(self):
         """Test getting status for non-existent plugin."""
-        mock_plugin_manager.get_plugin.return_value = None
+        self.mock_pm.get_plugin.return_value = None
 
         response = self.client.get('/api/plugins/nonexistent/status', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 404)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
-    @patch('app.plugin_manager')
-    def test_get_all_plugins_status(self, mock_plugin_manager):
+    def test_get_all_plugins_status(self):
         """Test getting status for all plugins."""
         # Mock list_plugins to return plugin names
-        mock_plugin_manager.list_plugins.return_value = ['ohio', 'virginia']
+        self.mock_pm.list_plugins.return_value = ['ohio', 'virginia']
         
         # Mock individual plugins
-        mock_ohio = Mock()
-        mock_ohio.get_status.return_value = {
-            'name': 'ohio',
-            'state_code': 'OH',
-            'status': 'healthy',
-            'last_sync': '2024-01-15T10:30:00Z'
-        }
+        mock_ohio = SimpleNamespace(get_status=lambda: _OHIO_STATUS)
         
-        mock_virginia = Mock()
-        mock_virginia.get_status.return_value = {
+        virginia_status = {
             'name': 'virginia',
             'state_code': 'VA',
             'status': 'healthy',
             'last_sync': '2024-01-15T11:00:00Z'
         }
+        mock_virginia = SimpleNamespace(get_status=lambda: virginia_status)
         
         # Mock get_plugin to return appropriate plugin based on name
         def get_plugin_side_effect(name):
@@ -550,12 +468,12 @@ class TestPluginStatusEndpoints(unittest.TestCase):
                 return mock_virginia
             return None
         
-        mock_plugin_manager.get_plugin.side_effect = get_plugin_side_effect
+        self.mock_pm.get_plugin.side_effect = get_plugin_side_effect
 
         response = self.client.get('/api/plugins/status', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads_response(response)
         self.assertEqual(len(data), 2)
         self.assertIn('ohio', data)
         self.assertIn('virginia', data)
@@ -563,41 +481,12 @@ class TestPluginStatusEndpoints(unittest.TestCase):
         self.assertEqual(data['virginia']['name'], 'virginia')
 
 
-class TestAPIErrorHandling(unittest.TestCase):
+class TestAPIErrorHandling(_APITestBase):
     """Unit tests for API error handling."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create a test API key for authentication
-        import secrets
-        test_api_key = APIKey()
-        test_api_key.key = secrets.token_urlsafe(32)
-        test_api_key.name = "Test API Key"
-        test_api_key.is_active = True
-        db.session.add(test_api_key)
-        db.session.commit()
-        
-        self.api_key = test_api_key.key
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-    
-    def get_authenticated_headers(self):
-        """Get headers with API key authentication."""
-        return {'X-API-Key': self.api_key}
+    # Raw request bodies shared by the malformed-input tests
+    _MALFORMED_BODY = b'invalid json'
+    _UNTYPED_BODY = b'{"test": "data"}'
 
     def test_invalid_endpoint(self):
         """Test accessing invalid endpoint."""
@@ -611,81 +500,43 @@ class TestAPIErrorHandling(unittest.TestCase):
         
         self.assertEqual(response.status_code, 405)  # Method Not Allowed
 
-    @patch('app.plugin_manager')
-    def test_plugin_manager_unavailable(self, mock_plugin_manager):
+    def test_plugin_manager_unavailable(self):
         """Test API when plugin manager is unavailable."""
-        mock_plugin_manager.list_plugins.side_effect = Exception("Plugin manager not initialized")
+        self.mock_pm.list_plugins.side_effect = Exception("Plugin manager not initialized")
 
         response = self.client.get('/api/plugins', headers=self.get_authenticated_headers())
         
         self.assertEqual(response.status_code, 500)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
     def test_malformed_json_request(self):
         """Test handling of malformed JSON requests."""
         response = self.client.post('/api/plugins/ohio/sync',
-                                 data='invalid json',
+                                 data=self._MALFORMED_BODY,
                                  content_type='application/json',
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
     def test_missing_content_type(self):
         """Test handling of missing content type."""
         response = self.client.post('/api/plugins/ohio/sync',
-                                 data='{"test": "data"}',
+                                 data=self._UNTYPED_BODY,
                                  headers=self.get_authenticated_headers())
 
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
+        self.assertIn(b'"error"', response.data)
 
 
-class TestAPIAuthentication(unittest.TestCase):
+class TestAPIAuthentication(_APITestBase):
     """Unit tests for API authentication."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create a test API key for authentication
-        import secrets
-        test_api_key = APIKey()
-        test_api_key.key = secrets.token_urlsafe(32)
-        test_api_key.name = "Test API Key"
-        test_api_key.is_active = True
-        db.session.add(test_api_key)
-        db.session.commit()
-        
-        self.api_key = test_api_key.key
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-    
-    def get_authenticated_headers(self):
-        """Get headers with API key authentication."""
-        return {'X-API-Key': self.api_key}
-
-    @patch('app.plugin_manager')
-    def test_unauthenticated_access(self, mock_plugin_manager):
+    def test_unauthenticated_access(self):
         """Test API access without authentication."""
         # This test assumes some endpoints require authentication
         # Adjust based on actual authentication requirements
-        mock_plugin_manager.list_plugins.return_value = []
+        self.mock_pm.list_plugins.return_value = []
 
         response = self.client.get('/api/plugins')
         
@@ -693,10 +544,9 @@ class TestAPIAuthentication(unittest.TestCase):
         # If not required, should return 200
         self.assertIn(response.status_code, [200, 401, 403])
 
-    @patch('app.plugin_manager')
-    def test_authenticated_access(self, mock_plugin_manager):
+    def test_authenticated_access(self):
         """Test API access with authentication."""
-        mock_plugin_manager.list_plugins.return_value = []
+        self.mock_pm.list_plugins.return_value = []
 
         # Test with authentication header if required
         response = self.client.get('/api/plugins', headers=self.get_authenticated_headers())
@@ -705,44 +555,10 @@ class TestAPIAuthentication(unittest.TestCase):
         self.assertIn(response.status_code, [200, 401])  # 401 if auth not actually implemented
 
 
-class TestAPIIntegration(unittest.TestCase):
+class TestAPIIntegration(_APITestBase):
     """Integration tests for API endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create a test API key for authentication
-        import secrets
-        test_api_key = APIKey()
-        test_api_key.key = secrets.token_urlsafe(32)
-        test_api_key.name = "Test API Key"
-        test_api_key.is_active = True
-        db.session.add(test_api_key)
-        db.session.commit()
-        
-        self.api_key = test_api_key.key
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-    
-    def get_authenticated_headers(self):
-        """Get headers with API key authentication."""
-        return {'X-API-Key': self.api_key}
-
-    @patch('app.plugin_manager')
-    def test_complete_plugin_workflow(self, mock_plugin_manager):
+    def test_complete_plugin_workflow(self):
         """Test complete plugin workflow through API."""
         mock_plugin = Mock()
         mock_plugin.name = 'test'
@@ -752,31 +568,23 @@ class TestAPIIntegration(unittest.TestCase):
             'state_code': 'TS',
             'status': 'loaded'
         }
-        mock_plugin.sync.return_value = {
-            'success': True,
-            'added': 10,
-            'updated': 5
-        }
-        mock_plugin_manager.get_plugin.return_value = mock_plugin
-        mock_plugin_manager.sync_plugin.return_value = {
-            'success': True,
-            'added': 10,
-            'updated': 5
-        }
-        mock_plugin_manager.list_plugins.return_value = [mock_plugin.get_status.return_value]
+        mock_plugin.sync.return_value = _SYNC_RESULT
+        self.mock_pm.get_plugin.return_value = mock_plugin
+        self.mock_pm.sync_plugin.return_value = _SYNC_RESULT
+        self.mock_pm.list_plugins.return_value = [mock_plugin.get_status.return_value]
 
         # Test listing plugins
         response = self.client.get('/api/plugins', headers=self.get_authenticated_headers())
         print(f"Response status: {response.status_code}")
         print(f"Response data: {response.data.decode()}")
         self.assertEqual(response.status_code, 200)
-        plugins = json.loads(response.data)
+        plugins = _loads_response(response)
         self.assertEqual(len(plugins['plugins']), 1)
 
         # Test getting plugin status
         response = self.client.get('/api/plugins/test/status', headers=self.get_authenticated_headers())
         self.assertEqual(response.status_code, 200)
-        status = json.loads(response.data)
+        status = _loads_response(response)
         self.assertEqual(status['name'], 'test')
 
         # Test syncing plugin
@@ -784,28 +592,27 @@ class TestAPIIntegration(unittest.TestCase):
                                  headers=self.get_authenticated_headers(),
                                  content_type='application/json')
         self.assertEqual(response.status_code, 200)
-        sync_result = json.loads(response.data)
+        sync_result = _loads_response(response)
         self.assertTrue(sync_result['success'])
 
     def test_api_response_format(self):
         """Test that API responses follow consistent format."""
         # Test successful response
-        with patch('app.plugin_manager') as mock_plugin_manager:
-            mock_plugin_manager.list_plugins.return_value = []
-            
-            response = self.client.get('/api/plugins', headers=self.get_authenticated_headers())
-            
-            # Should have proper content type
-            self.assertEqual(response.content_type, 'application/json')
-            
-            # Should be valid JSON
-            try:
-                data = json.loads(response.data)
-                self.assertIsInstance(data, dict)
-                self.assertIn('plugins', data)
-                self.assertIsInstance(data['plugins'], list)
-            except json.JSONDecodeError:
-                self.fail("Response is not valid JSON")
+        self.mock_pm.list_plugins.return_value = []
+        
+        response = self.client.get('/api/plugins', headers=self.get_authenticated_headers())
+        
+        # Should have proper content type
+        self.assertEqual(response.content_type, 'application/json')
+        
+        # Should be valid JSON
+        try:
+            data = _loads_response(response)
+            self.assertIsInstance(data, dict)
+            self.assertIn('plugins', data)
+            self.assertIsInstance(data['plugins'], list)
+        except orjson.JSONDecodeError:
+            self.fail("Response is not valid JSON")
 
     def test_api_cors_headers(self):
         """Test that API includes proper CORS headers."""
@@ -817,32 +624,64 @@ class TestAPIIntegration(unittest.TestCase):
         self.assertIn(response.status_code, [200, 404, 500])
 
 
-if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
+# Endpoint benchmarks (pytest-benchmark). Run on their own with
+# ``pytest tests/test_api_endpoints.py --benchmark-only``; skipped when the
+# plugin is not installed.
+BENCHMARK_AVAILABLE = importlib.util.find_spec('pytest_benchmark') is not None
+requires_benchmark = pytest.mark.skipif(not BENCHMARK_AVAILABLE, reason="pytest-benchmark not installed")
+
+_BENCHMARK_PLUGINS = [
+    {'name': 'ohio', 'state_code': 'OH', 'description': 'Ohio polling place data', 'status': 'loaded'},
+    {'name': 'virginia', 'state_code': 'VA', 'description': 'Virginia polling place data', 'status': 'loaded'}
+]
+
+
+@pytest.fixture
+def api_client(client, db_session):
+    """Test client and auth headers; the API key is rolled back afterwards."""
+    test_api_key = APIKey()
+    test_api_key.key = API_KEY
+    test_api_key.name = "Benchmark API Key"
+    test_api_key.is_active = True
+    db_session.add(test_api_key)
+    db_session.commit()
     
-    # Add all test classes
-    test_classes = [
-        TestPluginAPIEndpoints,
-        TestFileUploadEndpoints,
-        TestElectionEndpoints,
-        TestPluginStatusEndpoints,
-        TestAPIErrorHandling,
-        TestAPIAuthentication,
-        TestAPIIntegration
-    ]
+    # Benchmarks fire far more requests than any rate limit allows; app.py
+    # registers two limiters (per-address defaults and per-key limits)
+    with ExitStack() as stack:
+        for limiter in client.application.extensions.get('limiter', ()):
+            stack.enter_context(patch.object(limiter, 'enabled', False))
+        yield client, {'X-API-Key': test_api_key.key}
+
+
+@pytest.fixture
+def mock_plugin_manager():
+    """Patched plugin_manager for a single benchmark."""
+    with patch('app.plugin_manager') as mock:
+        yield mock
+
+
+@requires_benchmark
+def test_benchmark_list_plugins(api_client, mock_plugin_manager, benchmark):
+    """Benchmark the plugin listing endpoint."""
+    client, headers = api_client
+    mock_plugin_manager.list_plugins.return_value = _BENCHMARK_PLUGINS
     
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
+    response = benchmark(client.get, '/api/plugins', headers=headers)
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
+    assert response.status_code == 200
+
+
+@requires_benchmark
+def test_benchmark_plugin_status(api_client, mock_plugin_manager, benchmark):
+    """Benchmark the single plugin status endpoint."""
+    client, headers = api_client
+    mock_plugin_manager.get_plugin.return_value.get_status.return_value = _BENCHMARK_PLUGINS[0]
     
-    # Print summary
-    print(f"\nTest Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
\ No newline at end of file
+    response = benchmark(client.get, '/api/plugins/ohio/status', headers=headers)
+    
+    assert response.status_code == 200
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -9,125 +9,151 @@ Includes unit tests, integration tests, and error scenario tests for:
 - Configuration and environment variable handling
 """
 
-import pytest
-import unittest
-from unittest.mock import Mock, patch, MagicMock, call
+import importlib.util
 import os
+import pytest
+from unittest.mock import Mock
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-# Try to import Google Cloud BigQuery, skip tests if not available
+# Only the skip decision needs this, so look the package up without importing it
 try:
-    from google.cloud import bigquery
-    BIGQUERY_AVAILABLE = True
-except ImportError:
+    BIGQUERY_AVAILABLE = importlib.util.find_spec('google.cloud.bigquery') is not None
+except ModuleNotFoundError:
+    # find_spec imports the parent packages, which may be missing entirely
     BIGQUERY_AVAILABLE = False
-    bigquery = None
 
-# Import the plugin and models
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Only the tests use these, and they are all skipped without BigQuery
+if BIGQUERY_AVAILABLE:
+    from google.auth import exceptions as google_auth_exceptions
+    from google.cloud import exceptions as gcloud_exceptions
+
+# Skip the whole module when BigQuery is not installed
+pytestmark = pytest.mark.skipif(not BIGQUERY_AVAILABLE, reason="Google Cloud BigQuery not available")
+
+# A direct run puts tests/ rather than the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from plugins.bigquery_plugin import BigQueryPlugin
 
 
-@pytest.mark.skipif(not BIGQUERY_AVAILABLE, reason="Google Cloud BigQuery not available")
-@pytest.mark.skipif(not BIGQUERY_AVAILABLE, reason="Google Cloud BigQuery not available")
-class TestBigQueryConnection(unittest.TestCase):
-    """Unit tests for BigQuery plugin connection functionality."""
+@dataclass(slots=True)
+class Row:
+    """Query result row; the plugin only reads these attributes."""
+    precinctname: str
+    precinctcode: str
+    registered: int
+
+
+class _FakeJob:
+    """Stand-in for a BigQuery query job; the plugin only iterates its rows."""
+
+    __slots__ = ('rows',)
+
+    def __init__(self, rows):
+        self.rows = rows
 
-    def setUp(self):
-        """Set up test fixtures with mock app and database."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.plugin = BigQueryPlugin(self.mock_app, self.mock_db)
+    def __iter__(self):
+        return iter(self.rows)
 
-    @patch('plugins.bigquery_plugin.bigquery.Client')
-    def test_connect_to_bigquery_success(self, mock_client):
+
+@pytest.fixture(autouse=True)
+def _default_query_template(monkeypatch):
+    """Run every test against the built-in query unless it sets its own."""
+    monkeypatch.delenv('BIGQUERY_QUERY_TEMPLATE', raising=False)
+
+
+@pytest.fixture(scope='class')
+def _class_plugin():
+    """Set up the mock app, database and plugin once per class."""
+    app = Mock()
+    app.logger = Mock()
+    return BigQueryPlugin(app, Mock())
+
+
+@pytest.fixture
+def plugin(_class_plugin):
+    """Shared plugin with logger calls, the cached client and stubbed methods cleared."""
+    _class_plugin.app.logger.reset_mock()
+    _class_plugin.client = None
+    for name in ('connect_to_bigquery', 'fetch_polling_places'):
+        vars(_class_plugin).pop(name, None)
+    return _class_plugin
+
+
+@pytest.fixture(scope='session')
+def large_rows():
+    """Large result set, built once; the plugin only reads the rows."""
+    return tuple(Row(f'Precinct {i}', f'{i:03d}', 1000 + i) for i in range(1000))
+
+
+class TestBigQueryConnection:
+    """Unit tests for BigQuery plugin connection functionality."""
+
+    def test_connect_to_bigquery_success(self, plugin, monkeypatch):
         """Test successful BigQuery client connection."""
+        mock_client = Mock()
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
+        monkeypatch.setattr('plugins.bigquery_plugin.bigquery.Client', mock_client)
 
-        result = self.plugin.connect_to_bigquery()
+        result = plugin.connect_to_bigquery()
 
-        self.assertEqual(result, mock_client_instance)
+        assert result == mock_client_instance
         mock_client.assert_called_once()
-        self.assertEqual(self.plugin.client, mock_client_instance)
+        assert plugin.client == mock_client_instance
 
-    @patch('plugins.bigquery_plugin.bigquery.Client')
-    def test_connect_to_bigquery_cached(self, mock_client):
+    def test_connect_to_bigquery_cached(self, plugin, monkeypatch):
         """Test that BigQuery client is cached after first connection."""
+        mock_client = Mock()
         mock_client_instance = Mock()
         mock_client.return_value = mock_client_instance
+        monkeypatch.setattr('plugins.bigquery_plugin.bigquery.Client', mock_client)
 
         # First call should create client
-        result1 = self.plugin.connect_to_bigquery()
+        result1 = plugin.connect_to_bigquery()
         # Second call should return cached client
-        result2 = self.plugin.connect_to_bigquery()
+        result2 = plugin.connect_to_bigquery()
 
-        self.assertEqual(result1, mock_client_instance)
-        self.assertEqual(result2, mock_client_instance)
+        assert result1 == mock_client_instance
+        assert result2 == mock_client_instance
         # Should only call Client() once
         mock_client.assert_called_once()
 
-    @patch('plugins.bigquery_plugin.bigquery.Client')
-    def test_connect_to_bigquery_authentication_error(self, mock_client):
+    def test_connect_to_bigquery_authentication_error(self, plugin, monkeypatch):
         """Test BigQuery connection with authentication error."""
-        from google.auth.exceptions import DefaultCredentialsError
-        mock_client.side_effect = DefaultCredentialsError("Could not automatically determine credentials")
+        mock_client = Mock(side_effect=google_auth_exceptions.DefaultCredentialsError("Could not automatically determine credentials"))
+        monkeypatch.setattr('plugins.bigquery_plugin.bigquery.Client', mock_client)
 
-        with self.assertRaises(DefaultCredentialsError):
-            self.plugin.connect_to_bigquery()
+        with pytest.raises(google_auth_exceptions.DefaultCredentialsError):
+            plugin.connect_to_bigquery()
 
-    def test_plugin_properties(self):
+    def test_plugin_properties(self, plugin):
         """Test plugin property values."""
-        self.assertEqual(self.plugin.name, 'bigquery')
-        self.assertEqual(self.plugin.state_code, 'ALL')
-        self.assertEqual(self.plugin.description, 'BigQuery plugin for querying voter data by state')
+        assert plugin.name == 'bigquery'
+        assert plugin.state_code == 'ALL'
+        assert plugin.description == 'BigQuery plugin for querying voter data by state'
 
 
-@pytest.mark.skipif(not BIGQUERY_AVAILABLE, reason="Google Cloud BigQuery not available")
-class TestBigQueryQueryExecution(unittest.TestCase):
+class TestBigQueryQueryExecution:
     """Unit tests for BigQuery query execution functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.plugin = BigQueryPlugin(self.mock_app, self.mock_db)
-
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_fetch_polling_places_default_query(self, mock_getenv):
-        """Test query execution with default query template."""
-        mock_getenv.return_value = None  # Use default query
-        
-        # Mock BigQuery client and query job
-        mock_client = Mock()
-        mock_query_job = Mock()
-        mock_row = Mock()
-        mock_row.precinctname = 'Test Precinct'
-        mock_row.precinctcode = '001'
-        mock_row.registered = 1500
-        
-        mock_query_job.__iter__ = Mock(return_value=iter([mock_row]))
-        mock_client.query.return_value = mock_query_job
+    def test_get_voter_data_by_state(self, plugin):
+        """Test public method for getting voter data by state."""
+        mock_result = {'Test Precinct (001)': 1500}
         
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            result = self.plugin.fetch_polling_places('OH')
+        mock_fetch = plugin.fetch_polling_places = Mock(return_value=mock_result)
+        result = plugin.get_voter_data_by_state('OH')
 
-        expected_key = 'Test Precinct (001)'
-        self.assertEqual(result, {expected_key: 1500})
-        mock_client.query.assert_called_once()
-        
-        # Verify the query contains the state code
-        call_args = mock_client.query.call_args[0][0]
-        self.assertIn('OH', call_args)
+        assert result == mock_result
+        mock_fetch.assert_called_once_with('OH')
 
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_fetch_polling_places_custom_query(self, mock_getenv):
-        """Test query execution with custom query template."""
-        custom_query = """
+
+_CUSTOM_QUERY = """
         SELECT
             custom_precinct_name as precinctname,
             custom_precinct_code as precinctcode,
@@ -135,145 +161,89 @@ class TestBigQueryQueryExecution(unittest.TestCase):
         FROM custom_table
         WHERE state = '{state_code}'
         """
-        mock_getenv.return_value = custom_query
-        
-        # Mock BigQuery client and query job
-        mock_client = Mock()
-        mock_query_job = Mock()
-        mock_row = Mock()
-        mock_row.precinctname = 'Custom Precinct'
-        mock_row.precinctcode = 'XYZ'
-        mock_row.registered = 2000
-        
-        mock_query_job.__iter__ = Mock(return_value=iter([mock_row]))
-        mock_client.query.return_value = mock_query_job
-        
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            result = self.plugin.fetch_polling_places('CA')
 
-        expected_key = 'Custom Precinct (XYZ)'
-        self.assertEqual(result, {expected_key: 2000})
-        
-        # Verify the custom query was used with state code substitution
-        call_args = mock_client.query.call_args[0][0]
-        self.assertIn('CA', call_args)
-        self.assertIn('custom_table', call_args)
 
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_fetch_polling_places_multiple_rows(self, mock_getenv):
-        """Test query execution returning multiple rows."""
-        mock_getenv.return_value = None  # Use default query
-        
-        # Mock multiple rows
-        mock_rows = [
-            Mock(precinctname='Precinct A', precinctcode='001', registered=1000),
-            Mock(precinctname='Precinct B', precinctcode='002', registered=1500),
-            Mock(precinctname='Precinct C', precinctcode='003', registered=2000)
-        ]
-        
-        mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter(mock_rows))
-        mock_client.query.return_value = mock_query_job
-        
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            result = self.plugin.fetch_polling_places('OH')
-
-        expected = {
+@pytest.mark.parametrize("env_query,state,rows,expected,query_fragments", [
+    pytest.param(
+        None, 'OH', [Row('Test Precinct', '001', 1500)],
+        {'Test Precinct (001)': 1500}, ['OH'],
+        id='default_query'
+    ),
+    pytest.param(
+        _CUSTOM_QUERY, 'CA', [Row('Custom Precinct', 'XYZ', 2000)],
+        {'Custom Precinct (XYZ)': 2000}, ['CA', 'custom_table'],
+        id='custom_query'
+    ),
+    pytest.param(
+        None, 'OH',
+        [
+            Row('Precinct A', '001', 1000),
+            Row('Precinct B', '002', 1500),
+            Row('Precinct C', '003', 2000)
+        ],
+        {
             'Precinct A (001)': 1000,
             'Precinct B (002)': 1500,
             'Precinct C (003)': 2000
-        }
-        self.assertEqual(result, expected)
-
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_fetch_polling_places_default_state(self, mock_getenv):
-        """Test query execution with default state code."""
-        mock_getenv.return_value = None  # Use default query
-        
-        mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter([]))
-        mock_client.query.return_value = mock_query_job
-        
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            self.plugin.fetch_polling_places()  # No state specified
-
-        # Should use default state 'OH'
-        call_args = mock_client.query.call_args[0][0]
-        self.assertIn('OH', call_args)
-
-    def test_get_voter_data_by_state(self):
-        """Test public method for getting voter data by state."""
-        mock_result = {'Test Precinct (001)': 1500}
-        
-        with patch.object(self.plugin, 'fetch_polling_places', return_value=mock_result) as mock_fetch:
-            result = self.plugin.get_voter_data_by_state('OH')
-
-        self.assertEqual(result, mock_result)
-        mock_fetch.assert_called_once_with('OH')
+        },
+        ['OH'],
+        id='multiple_rows'
+    ),
+    # No state passed: the plugin falls back to 'OH'
+    pytest.param(None, None, [], {}, ['OH'], id='default_state'),
+    pytest.param(None, 'OH', [], {}, ['OH'], id='empty_query_results'),
+    # Invalid states are still queried as given
+    pytest.param(None, 'XX', [], {}, ['XX'], id='invalid_state_code'),
+    pytest.param(None, 'CA', [], {}, ['CA'], id='substitution_CA'),
+    pytest.param(None, 'NY', [], {}, ['NY'], id='substitution_NY'),
+    pytest.param(None, 'TX', [], {}, ['TX'], id='substitution_TX'),
+])
+def test_fetch_polling_places(plugin, monkeypatch, env_query, state, rows, expected, query_fragments):
+    """Test the query template, state substitution and row processing."""
+    if env_query is not None:
+        monkeypatch.setenv('BIGQUERY_QUERY_TEMPLATE', env_query)
+    
+    mock_client = Mock()
+    mock_client.query.return_value = _FakeJob(rows)
+    plugin.connect_to_bigquery = lambda: mock_client
+    
+    if state is None:
+        result = plugin.fetch_polling_places()
+    else:
+        result = plugin.fetch_polling_places(state)
+    
+    assert result == expected
+    mock_client.query.assert_called_once()
+    query = mock_client.query.call_args[0][0]
+    for fragment in query_fragments:
+        assert fragment in query
+    plugin.app.logger.info.assert_called_with(
+        f"Retrieved {len(expected)} precincts for state {state or 'OH'}"
+    )
 
 
-@pytest.mark.skipif(not BIGQUERY_AVAILABLE, reason="Google Cloud BigQuery not available")
-class TestBigQueryErrorScenarios(unittest.TestCase):
+class TestBigQueryErrorScenarios:
     """Error scenario tests for BigQuery plugin."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.plugin = BigQueryPlugin(self.mock_app, self.mock_db)
-
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_query_execution_error(self, mock_getenv):
+    def test_query_execution_error(self, plugin):
         """Test handling of BigQuery query execution errors."""
-        mock_getenv.return_value = None  # Use default query
-        
-        from google.cloud import exceptions
         mock_client = Mock()
-        mock_client.query.side_effect = exceptions.GoogleCloudError("Query failed")
+        mock_client.query.side_effect = gcloud_exceptions.GoogleCloudError("Query failed")
         
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            with self.assertRaises(Exception) as context:
-                self.plugin.fetch_polling_places('OH')
+        plugin.connect_to_bigquery = lambda: mock_client
+        with pytest.raises(Exception, match="Failed to query BigQuery"):
+            plugin.fetch_polling_places('OH')
 
-        self.assertIn("Failed to query BigQuery", str(context.exception))
-        self.mock_app.logger.error.assert_called()
+        plugin.app.logger.error.assert_called()
 
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_connection_error(self, mock_getenv):
+    def test_connection_error(self, plugin):
         """Test handling of BigQuery connection errors."""
-        mock_getenv.return_value = None  # Use default query
-        
-        from google.auth.exceptions import DefaultCredentialsError
-        with patch.object(self.plugin, 'connect_to_bigquery', side_effect=DefaultCredentialsError("Auth failed")):
-            with self.assertRaises(Exception) as context:
-                self.plugin.fetch_polling_places('OH')
-
-        self.assertIn("Failed to query BigQuery", str(context.exception))
-
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_empty_query_results(self, mock_getenv):
-        """Test handling of empty query results."""
-        mock_getenv.return_value = None  # Use default query
-        
-        mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter([]))
-        mock_client.query.return_value = mock_query_job
-        
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            result = self.plugin.fetch_polling_places('OH')
+        plugin.connect_to_bigquery = Mock(side_effect=google_auth_exceptions.DefaultCredentialsError("Auth failed"))
+        with pytest.raises(Exception, match="Failed to query BigQuery"):
+            plugin.fetch_polling_places('OH')
 
-        self.assertEqual(result, {})
-        self.mock_app.logger.info.assert_called_with("Retrieved 0 precincts for state OH")
-
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_malformed_query_results(self, mock_getenv):
+    def test_malformed_query_results(self, plugin):
         """Test handling of malformed query results."""
-        mock_getenv.return_value = None  # Use default query
-        
         # Mock row with missing attributes
         mock_row = Mock()
         del mock_row.precinctname  # Remove required attribute
@@ -281,257 +251,134 @@ class TestBigQueryErrorScenarios(unittest.TestCase):
         mock_row.registered = 1500
         
         mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter([mock_row]))
-        mock_client.query.return_value = mock_query_job
+        mock_client.query.return_value = _FakeJob([mock_row])
         
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            with self.assertRaises(Exception) as context:
-                self.plugin.fetch_polling_places('OH')
-            self.assertIn("Failed to query BigQuery", str(context.exception))
-
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_invalid_state_code(self, mock_getenv):
-        """Test handling of invalid state codes."""
-        mock_getenv.return_value = None  # Use default query
-        
-        mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter([]))
-        mock_client.query.return_value = mock_query_job
-        
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            # Should still attempt query with invalid state
-            result = self.plugin.fetch_polling_places('XX')
-
-        self.assertEqual(result, {})
-        # Verify the invalid state was used in query
-        call_args = mock_client.query.call_args[0][0]
-        self.assertIn('XX', call_args)
+        plugin.connect_to_bigquery = lambda: mock_client
+        with pytest.raises(Exception, match="Failed to query BigQuery"):
+            plugin.fetch_polling_places('OH')
 
-    def test_large_result_set(self):
+    def test_large_result_set(self, plugin, large_rows):
         """Test handling of large result sets."""
-        # Mock many rows to test performance
-        mock_rows = []
-        for i in range(1000):
-            mock_row = Mock()
-            mock_row.precinctname = f'Precinct {i}'
-            mock_row.precinctcode = f'{i:03d}'
-            mock_row.registered = 1000 + i
-            mock_rows.append(mock_row)
-
         mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter(mock_rows))
-        mock_client.query.return_value = mock_query_job
+        mock_client.query.return_value = _FakeJob(large_rows)
         
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            result = self.plugin.fetch_polling_places('OH')
+        plugin.connect_to_bigquery = lambda: mock_client
+        result = plugin.fetch_polling_places('OH')
 
-        self.assertEqual(len(result), 1000)
-        self.assertEqual(result['Precinct 0 (000)'], 1000)
-        self.assertEqual(result['Precinct 999 (999)'], 1999)
+        assert len(result) == 1000
+        assert result['Precinct 0 (000)'] == 1000
+        assert result['Precinct 999 (999)'] == 1999
 
 
-@pytest.mark.skipif(not BIGQUERY_AVAILABLE, reason="Google Cloud BigQuery not available")
-class TestBigQueryConfiguration(unittest.TestCase):
+class TestBigQueryConfiguration:
     """Tests for BigQuery plugin configuration."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.plugin = BigQueryPlugin(self.mock_app, self.mock_db)
-
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_environment_variable_configuration(self, mock_getenv):
+    def test_environment_variable_configuration(self, plugin, monkeypatch):
         """Test configuration via environment variables."""
         custom_query = """
         SELECT custom_fields FROM custom_table WHERE state = '{state_code}'
         """
-        mock_getenv.return_value = custom_query
+        monkeypatch.setenv('BIGQUERY_QUERY_TEMPLATE', custom_query)
         
         mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter([]))
-        mock_client.query.return_value = mock_query_job
+        mock_client.query.return_value = _FakeJob([])
         
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            self.plugin.fetch_polling_places('OH')
+        plugin.connect_to_bigquery = lambda: mock_client
+        plugin.fetch_polling_places('OH')
 
         # Verify custom query was used
         call_args = mock_client.query.call_args[0][0]
-        self.assertIn('custom_fields', call_args)
-        self.assertIn('custom_table', call_args)
+        assert 'custom_fields' in call_args
+        assert 'custom_table' in call_args
 
-    @patch('plugins.bigquery_plugin.os.getenv')
-    def test_missing_environment_variable(self, mock_getenv):
+    def test_missing_environment_variable(self, plugin):
         """Test behavior when environment variable is missing."""
-        mock_getenv.return_value = None  # Environment variable not set
-        
         mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter([]))
-        mock_client.query.return_value = mock_query_job
+        mock_client.query.return_value = _FakeJob([])
         
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            self.plugin.fetch_polling_places('OH')
+        plugin.connect_to_bigquery = lambda: mock_client
+        plugin.fetch_polling_places('OH')
 
         # Should use default query
         call_args = mock_client.query.call_args[0][0]
-        self.assertIn('prod-sv-oh-dd7a76f2.catalist_OH.Person', call_args)
-
-    def test_query_template_substitution(self):
-        """Test that state code is properly substituted in query template."""
-        test_cases = [
-            ('OH', 'OH'),
-            ('CA', 'CA'),
-            ('NY', 'NY'),
-            ('TX', 'TX')
-        ]
-
-        for state_code, expected_substitution in test_cases:
-            with self.subTest(state=state_code):
-                mock_client = Mock()
-                mock_query_job = Mock()
-                mock_query_job.__iter__ = Mock(return_value=iter([]))
-                mock_client.query.return_value = mock_query_job
-                
-                with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-                    self.plugin.fetch_polling_places(state_code)
-
-                # Verify state code was substituted
-                call_args = mock_client.query.call_args[0][0]
-                self.assertIn(expected_substitution, call_args)
+        assert 'prod-sv-oh-dd7a76f2.catalist_OH.Person' in call_args
 
 
-@pytest.mark.skipif(not BIGQUERY_AVAILABLE, reason="Google Cloud BigQuery not available")
-class TestBigQueryIntegration(unittest.TestCase):
+class TestBigQueryIntegration:
     """Integration tests for BigQuery plugin workflow."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.plugin = BigQueryPlugin(self.mock_app, self.mock_db)
-
-    def test_complete_workflow(self):
+    def test_complete_workflow(self, plugin):
         """Test complete workflow from connection to data retrieval."""
         # Mock realistic BigQuery response
         mock_rows = [
-            Mock(precinctname='Franklin County Precinct 1A', precinctcode='001A', registered=1250),
-            Mock(precinctname='Franklin County Precinct 2B', precinctcode='002B', registered=1450),
-            Mock(precinctname='Cuyahoga County Precinct 10C', precinctcode='010C', registered=2100)
+            Row('Franklin County Precinct 1A', '001A', 1250),
+            Row('Franklin County Precinct 2B', '002B', 1450),
+            Row('Cuyahoga County Precinct 10C', '010C', 2100)
         ]
 
         mock_client = Mock()
-        mock_query_job = Mock()
-        mock_query_job.__iter__ = Mock(return_value=iter(mock_rows))
-        mock_client.query.return_value = mock_query_job
+        mock_client.query.return_value = _FakeJob(mock_rows)
         
-        with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-            result = self.plugin.fetch_polling_places('OH')
+        plugin.connect_to_bigquery = lambda: mock_client
+        result = plugin.fetch_polling_places('OH')
 
         expected = {
             'Franklin County Precinct 1A (001A)': 1250,
             'Franklin County Precinct 2B (002B)': 1450,
             'Cuyahoga County Precinct 10C (010C)': 2100
         }
-        self.assertEqual(result, expected)
+        assert result == expected
         
         # Verify logging
-        self.mock_app.logger.info.assert_called_with("Retrieved 3 precincts for state OH")
+        plugin.app.logger.info.assert_called_with("Retrieved 3 precincts for state OH")
 
-    def test_multiple_state_queries(self):
+    def test_multiple_state_queries(self, plugin):
         """Test querying multiple states."""
         states = ['OH', 'CA', 'TX']
         results = {}
         
         mock_client = Mock()
+        plugin.connect_to_bigquery = lambda: mock_client
         
         for state in states:
             # Mock different results for each state
-            mock_rows = [Mock(precinctname=f'{state} Precinct', precinctcode='001', registered=1000)]
-            mock_query_job = Mock()
-            mock_query_job.__iter__ = Mock(return_value=iter(mock_rows))
-            mock_client.query.return_value = mock_query_job
+            mock_rows = [Row(f'{state} Precinct', '001', 1000)]
+            mock_client.query.return_value = _FakeJob(mock_rows)
             
-            with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-                results[state] = self.plugin.fetch_polling_places(state)
+            results[state] = plugin.fetch_polling_places(state)
 
         # Verify each state was queried correctly
-        self.assertEqual(len(results), 3)
+        assert len(results) == 3
         for state in states:
-            self.assertIn(f'{state} Precinct (001)', results[state])
-            self.assertEqual(results[state][f'{state} Precinct (001)'], 1000)
+            assert results[state][f'{state} Precinct (001)'] == 1000
 
-    def test_concurrent_queries(self):
-        """Test handling of concurrent queries."""
-        import threading
-        import time
+    def test_concurrent_queries(self, plugin, monkeypatch):
+        """Test concurrent queries on one plugin each get their own state's rows."""
+        monkeypatch.setenv('BIGQUERY_QUERY_TEMPLATE', "SELECT * FROM t WHERE state = '{state_code}'")
+        states = ['OH', 'CA', 'TX', 'NY', 'FL']
+        # Hold every worker until all are ready so the queries really overlap
+        barrier = threading.Barrier(len(states), timeout=5)
 
-        results = {}
-        errors = []
+        def run_query(query):
+            match = re.search(r"state = '(\w+)'", query)
+            assert match is not None
+            state = match.group(1)
+            return _FakeJob([Row(f'{state} Precinct', '001', 1000)])
+
+        mock_client = Mock()
+        mock_client.query.side_effect = run_query
+        plugin.connect_to_bigquery = lambda: mock_client
 
         def query_state(state):
-            try:
-                mock_rows = [Mock(precinctname=f'{state} Precinct', precinctcode='001', registered=1000)]
-                mock_client = Mock()
-                mock_query_job = Mock()
-                mock_query_job.__iter__ = Mock(return_value=iter(mock_rows))
-                mock_client.query.return_value = mock_query_job
-                
-                with patch.object(self.plugin, 'connect_to_bigquery', return_value=mock_client):
-                    results[state] = self.plugin.fetch_polling_places(state)
-            except Exception as e:
-                errors.append(e)
-
-        # Create multiple threads for concurrent queries
-        threads = []
-        states = ['OH', 'CA', 'TX', 'NY', 'FL']
-        
-        for state in states:
-            thread = threading.Thread(target=query_state, args=(state,))
-            threads.append(thread)
-            thread.start()
+            barrier.wait()
+            return plugin.fetch_polling_places(state)
 
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=len(states)) as executor:
+            results = dict(zip(states, executor.map(query_state, states)))
 
-        # Verify all queries completed successfully
-        self.assertEqual(len(errors), 0)
-        self.assertEqual(len(results), len(states))
         for state in states:
-            self.assertIn(state, results)
+            assert results[state] == {f'{state} Precinct (001)': 1000}
 
 
 if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [
-        TestBigQueryConnection,
-        TestBigQueryQueryExecution,
-        TestBigQueryErrorScenarios,
-        TestBigQueryConfiguration,
-        TestBigQueryIntegration
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Print summary
-    print(f"\nTest Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
\ No newline at end of file
+    pytest.main([__file__])
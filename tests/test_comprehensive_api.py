@@ -10,70 +10,125 @@ Tests cover:
 - Bulk operations
 - Plugin management endpoints
 - Geocoding endpoints
+
+Each test runs in a rolled-back transaction on a per-worker in-memory
+database, so the module can run in parallel:
+
+    pytest tests/test_comprehensive_api.py -n auto
 """
 
 import pytest
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import json
+from unittest.mock import Mock, patch
 import tempfile
 import os
+import sys
 import time
 from datetime import datetime, date
+from typing import Optional
 from io import BytesIO
+from flask.testing import FlaskClient
+from sqlalchemy import select
 
-# Import Flask app and related modules
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# A direct run puts tests/ rather than the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import app
+# app.py is imported by the session fixtures in conftest.py, so collecting
+# this module does not build the whole application
 from models import PollingPlace, Precinct, Election, APIKey, AdminUser, db
 
+# Master key patched into the environment for the classes that create keys
+MASTER_API_KEY = 'test-master-key-123'
+MASTER_HEADERS = {'X-API-Key': MASTER_API_KEY}
 
-class TestAuthenticationScenarios(unittest.TestCase):
+
+def _fast_truncate():
+    """Delete every row from every table, children before parents.
+    
+    The schema is created once per session, so clearing rows is enough and
+    far cheaper than dropping and recreating the tables.
+    """
+    for table in reversed(db.metadata.sorted_tables):
+        db.session.execute(table.delete())
+    db.session.commit()
+
+
+@pytest.mark.usefixtures('class_client', 'db_session')
+class _ComprehensiveAPITestBase(unittest.TestCase):
+    """Shared client, API key and per-class seed data for the API tests.
+    
+    Each test runs inside the db_session savepoint, so only the rows seeded
+    here outlive a test; tearDownClass removes them.
+    """
+
+    # Set by the class_client fixture
+    client: FlaskClient
+
+    # Seeded once per class; None for classes that manage their own keys
+    API_KEY: Optional[str] = "test-key-12345"
+    headers = {'X-API-Key': API_KEY}
+
+    @classmethod
+    def setUpClass(cls):
+        """Seed the API key and the class's own rows once."""
+        if cls.API_KEY:
+            api_key = APIKey()
+            api_key.key = cls.API_KEY
+            api_key.name = "Test Key"
+            api_key.is_active = True
+            db.session.add(api_key)
+        cls.seed()
+        db.session.commit()
+        db.session.remove()
+
+    @classmethod
+    def seed(cls):
+        """Add rows shared by every test in the class to db.session."""
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the class's seed rows; each test's own writes were rolled back."""
+        _fast_truncate()
+        db.session.remove()
+
+
+@patch.dict(os.environ, {'MASTER_API_KEY': MASTER_API_KEY})
+class TestAuthenticationScenarios(_ComprehensiveAPITestBase):
     """Test all authentication scenarios for API endpoints."""
 
+    API_KEY = None
+    ACTIVE_KEY = "test-active-key-12345"
+    INACTIVE_KEY = "test-inactive-key-67890"
+    ACTIVE_HEADERS = {'X-API-Key': ACTIVE_KEY}
+    INACTIVE_HEADERS = {'X-API-Key': INACTIVE_KEY}
+
     def setUp(self):
         """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create test API keys
-        self.active_key = APIKey()
-        self.active_key.key = "test-active-key-12345"
-        self.active_key.name = "Active Test Key"
-        self.active_key.is_active = True
-        self.active_key.rate_limit_per_day = 100
-        self.active_key.rate_limit_per_hour = 10
-        db.session.add(self.active_key)
-        
-        self.inactive_key = APIKey()
-        self.inactive_key.key = "test-inactive-key-67890"
-        self.inactive_key.name = "Inactive Test Key"
-        self.inactive_key.is_active = False
-        db.session.add(self.inactive_key)
-        
+        # Create test API keys in one INSERT
+        db.session.execute(APIKey.__table__.insert(), [
+            {
+                'key': self.ACTIVE_KEY,
+                'name': "Active Test Key",
+                'is_active': True,
+                'rate_limit_per_day': 100,
+                'rate_limit_per_hour': 10,
+            },
+            {
+                'key': self.INACTIVE_KEY,
+                'name': "Inactive Test Key",
+                'is_active': False,
+                'rate_limit_per_day': None,
+                'rate_limit_per_hour': None,
+            },
+        ])
         db.session.commit()
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-
     def test_no_api_key_access(self):
         """Test access without API key should return 401."""
         response = self.client.get('/api/polling-places?state=VA')
         self.assertEqual(response.status_code, 401)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('API key required', data['error'])
 
     def test_invalid_api_key_access(self):
@@ -81,46 +136,41 @@ class TestAuthenticationScenarios(unittest.TestCase):
         headers = {'X-API-Key': 'invalid-key-123'}
         response = self.client.get('/api/polling-places?state=VA', headers=headers)
         self.assertEqual(response.status_code, 401)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('Invalid or inactive API key', data['error'])
 
     def test_inactive_api_key_access(self):
         """Test access with inactive API key should return 401."""
-        headers = {'X-API-Key': self.inactive_key.key}
-        response = self.client.get('/api/polling-places?state=VA', headers=headers)
+        response = self.client.get('/api/polling-places?state=VA', headers=self.INACTIVE_HEADERS)
         self.assertEqual(response.status_code, 401)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('Invalid or inactive API key', data['error'])
 
     def test_api_key_last_used_updated(self):
         """Test that API key last_used_at is updated on successful access."""
-        original_last_used = self.active_key.last_used_at
-        headers = {'X-API-Key': self.active_key.key}
+        last_used = select(APIKey.last_used_at).where(APIKey.key == self.ACTIVE_KEY)
+        original_last_used = db.session.scalar(last_used)
         
         # Test health endpoint which doesn't require plugin manager
-        response = self.client.get('/health', headers=headers)
+        with patch.dict(self.client.application.config, {'SKIP_LAST_USED_UPDATE': False}):
+            response = self.client.get('/health', headers=self.ACTIVE_HEADERS)
         
         # Check that last_used_at was updated
-        updated_key = APIKey.query.get(self.active_key.id)
-        self.assertNotEqual(updated_key.last_used_at, original_last_used)
+        self.assertNotEqual(db.session.scalar(last_used), original_last_used)
 
-    @patch.dict(os.environ, {'MASTER_API_KEY': 'test-master-key-123'})
     def test_master_key_create_api_key(self):
         """Test creating API key with master key."""
-        headers = {'X-API-Key': 'test-master-key-123'}
         data = {'name': 'New Test Key', 'rate_limit_per_day': 50}
         
         response = self.client.post('/api/keys', 
-                                  headers=headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  headers=MASTER_HEADERS,
+                                  json=data)
         
         self.assertEqual(response.status_code, 201)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('key', response_data)
         self.assertEqual(response_data['key']['name'], 'New Test Key')
 
-    @patch.dict(os.environ, {'MASTER_API_KEY': 'test-master-key-123'})
     def test_invalid_master_key_create_api_key(self):
         """Test creating API key with invalid master key."""
         headers = {'X-API-Key': 'invalid-master-key'}
@@ -128,11 +178,10 @@ class TestAuthenticationScenarios(unittest.TestCase):
         
         response = self.client.post('/api/keys', 
                                   headers=headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  json=data)
         
         self.assertEqual(response.status_code, 401)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('Master API key required', response_data['error'])
 
     def test_api_key_list_requires_authentication(self):
@@ -142,64 +191,53 @@ class TestAuthenticationScenarios(unittest.TestCase):
 
     def test_api_key_list_with_valid_key(self):
         """Test listing API keys with valid authentication."""
-        headers = {'X-API-Key': self.active_key.key}
-        response = self.client.get('/api/keys', headers=headers)
+        response = self.client.get('/api/keys', headers=self.ACTIVE_HEADERS)
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('keys', response_data)
         self.assertEqual(len(response_data['keys']), 2)  # Both keys we created
 
 
-class TestRateLimiting(unittest.TestCase):
+class TestRateLimiting(_ComprehensiveAPITestBase):
     """Test rate limiting functionality."""
 
+    API_KEY = None
+    LIMITED_KEY = "limited-key-12345"
+    UNLIMITED_KEY = "unlimited-key-12345"
+    LIMITED_HEADERS = {'X-API-Key': LIMITED_KEY}
+    UNLIMITED_HEADERS = {'X-API-Key': UNLIMITED_KEY}
+
     def setUp(self):
         """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
         # Create test API key with rate limits
-        self.limited_key = APIKey()
-        self.limited_key.key = "limited-key-12345"
-        self.limited_key.name = "Limited Test Key"
-        self.limited_key.is_active = True
-        self.limited_key.rate_limit_per_day = 5
-        self.limited_key.rate_limit_per_hour = 2
-        db.session.add(self.limited_key)
+        limited_key = APIKey()
+        limited_key.key = self.LIMITED_KEY
+        limited_key.name = "Limited Test Key"
+        limited_key.is_active = True
+        limited_key.rate_limit_per_day = 5
+        limited_key.rate_limit_per_hour = 2
+        db.session.add(limited_key)
         db.session.commit()
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-
     def test_rate_limit_enforcement(self):
-        """Test that rate limits are enforced."""
-        headers = {'X-API-Key': self.limited_key.key}
+        """Test that a request over the key's limits gets a 429."""
+        from app import limiter
         
-        # Make multiple requests quickly to hit rate limit
-        responses = []
-        for i in range(10):
-            response = self.client.get('/health', headers=headers)
-            responses.append(response.status_code)
-            if response.status_code == 429:
-                break
+        # The key has a per-day and a per-hour limit, so each request checks
+        # two windows; the second request breaches the first window it checks
+        with patch.object(limiter.limiter, 'hit', side_effect=[True, True, False, True]) as mock_hit:
+            first = self.client.get('/health', headers=self.LIMITED_HEADERS)
+            second = self.client.get('/health', headers=self.LIMITED_HEADERS)
         
-        # Should eventually hit rate limit
-        self.assertIn(429, responses)
+        self.assertNotEqual(first.status_code, 429)
+        self.assertEqual(second.status_code, 429)
+        checked = {str(call_args.args[0]) for call_args in mock_hit.call_args_list}
+        self.assertEqual(checked, {'2 per 1 hour', '5 per 1 day'})
 
     def test_unlimited_api_key(self):
         """Test API key without rate limits."""
         unlimited_key = APIKey()
-        unlimited_key.key = "unlimited-key-12345"
+        unlimited_key.key = self.UNLIMITED_KEY
         unlimited_key.name = "Unlimited Test Key"
         unlimited_key.is_active = True
         unlimited_key.rate_limit_per_day = None
@@ -207,66 +245,34 @@ class TestRateLimiting(unittest.TestCase):
         db.session.add(unlimited_key)
         db.session.commit()
         
-        headers = {'X-API-Key': unlimited_key.key}
-        
         # Should not hit rate limits for health endpoint
         for i in range(10):
-            response = self.client.get('/health', headers=headers)
+            response = self.client.get('/health', headers=self.UNLIMITED_HEADERS)
             self.assertNotEqual(response.status_code, 429)
 
 
-class TestDataValidation(unittest.TestCase):
+@patch.dict(os.environ, {'MASTER_API_KEY': MASTER_API_KEY})
+class TestDataValidation(_ComprehensiveAPITestBase):
     """Test data validation for all API endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create test API key
-        self.api_key = APIKey()
-        self.api_key.key = "test-key-12345"
-        self.api_key.name = "Test Key"
-        self.api_key.is_active = True
-        db.session.add(self.api_key)
-        db.session.commit()
-        
-        self.headers = {'X-API-Key': self.api_key.key}
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-
     def test_polling_places_missing_state_parameter(self):
         """Test polling places endpoint without required state parameter."""
         response = self.client.get('/api/polling-places', headers=self.headers)
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('State parameter is required', data['error'])
 
     def test_create_api_key_missing_name(self):
         """Test creating API key without required name parameter."""
-        with patch.dict(os.environ, {'MASTER_API_KEY': 'test-master-key-123'}):
-            headers = {'X-API-Key': 'test-master-key-123'}
-            data = {'rate_limit_per_day': 100}
-            
-            response = self.client.post('/api/keys', 
-                                      headers=headers,
-                                      data=json.dumps(data),
-                                      content_type='application/json')
-            
-            self.assertEqual(response.status_code, 400)
-            response_data = json.loads(response.data)
-            self.assertIn('Name required', response_data['error'])
+        data = {'rate_limit_per_day': 100}
+        
+        response = self.client.post('/api/keys', 
+                                  headers=MASTER_HEADERS,
+                                  json=data)
+        
+        self.assertEqual(response.status_code, 400)
+        response_data = response.get_json()
+        self.assertIn('Name required', response_data['error'])
 
     def test_bulk_delete_invalid_delete_types(self):
         """Test bulk delete with invalid delete types."""
@@ -277,11 +283,10 @@ class TestDataValidation(unittest.TestCase):
         
         response = self.client.post('/api/bulk-delete',
                                   headers=self.headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  json=data)
         
         self.assertEqual(response.status_code, 400)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('Invalid delete_types', response_data['error'])
 
     def test_bulk_delete_missing_confirmation(self):
@@ -293,11 +298,10 @@ class TestDataValidation(unittest.TestCase):
         
         response = self.client.post('/api/bulk-delete',
                                   headers=self.headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  json=data)
         
         self.assertEqual(response.status_code, 400)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('Confirmation required', response_data['error'])
 
     def test_bulk_delete_invalid_date_format(self):
@@ -310,45 +314,16 @@ class TestDataValidation(unittest.TestCase):
         
         response = self.client.post('/api/bulk-delete',
                                   headers=self.headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  json=data)
         
         self.assertEqual(response.status_code, 400)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('Invalid start_date format', response_data['error'])
 
 
-class TestErrorHandling(unittest.TestCase):
+class TestErrorHandling(_ComprehensiveAPITestBase):
     """Test error handling and edge cases."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create test API key
-        self.api_key = APIKey()
-        self.api_key.key = "test-key-12345"
-        self.api_key.name = "Test Key"
-        self.api_key.is_active = True
-        db.session.add(self.api_key)
-        db.session.commit()
-        
-        self.headers = {'X-API-Key': self.api_key.key}
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
-
     def test_404_invalid_endpoint(self):
         """Test 404 for invalid endpoint."""
         response = self.client.get('/api/invalid-endpoint', headers=self.headers)
@@ -376,76 +351,62 @@ class TestErrorHandling(unittest.TestCase):
         
         self.assertEqual(response.status_code, 400)
 
-    def test_nonexistent_polling_place(self):
-        """Test getting non-existent polling place."""
-        response = self.client.get('/api/polling-places/999999', headers=self.headers)
-        self.assertEqual(response.status_code, 404)
-
-    def test_nonexistent_precinct(self):
-        """Test getting non-existent precinct."""
-        response = self.client.get('/api/precincts/999999', headers=self.headers)
-        self.assertEqual(response.status_code, 404)
-
-    def test_nonexistent_election(self):
-        """Test getting non-existent election."""
-        response = self.client.get('/api/elections/999999', headers=self.headers)
-        self.assertEqual(response.status_code, 404)
+    def test_nonexistent_resources(self):
+        """Test getting non-existent polling places, precincts and elections."""
+        for path in ('/api/polling-places/999999', '/api/precincts/999999', '/api/elections/999999'):
+            with self.subTest(path=path):
+                response = self.client.get(path, headers=self.headers)
+                self.assertEqual(response.status_code, 404)
 
 
-class TestVIPFormatResponses(unittest.TestCase):
+class TestVIPFormatResponses(_ComprehensiveAPITestBase):
     """Test VIP format responses for polling places."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create test API key
-        self.api_key = APIKey()
-        self.api_key.key = "test-key-12345"
-        self.api_key.name = "Test Key"
-        self.api_key.is_active = True
-        db.session.add(self.api_key)
-        
-        # Create test polling place
-        self.polling_place = PollingPlace()
-        self.polling_place.id = "test-pp-001"
-        self.polling_place.name = "Test Polling Place"
-        self.polling_place.address_line1 = "123 Main St"
-        self.polling_place.city = "Test City"
-        self.polling_place.state = "VA"
-        self.polling_place.zip_code = "12345"
-        self.polling_place.county = "Test County"
-        self.polling_place.latitude = 37.7749
-        self.polling_place.longitude = -122.4194
-        self.polling_place.polling_hours = "7:00 AM - 8:00 PM"
-        self.polling_place.voter_services = "Parking, Accessibility"
-        self.polling_place.source_plugin = "test"
-        db.session.add(self.polling_place)
-        db.session.commit()
-        
-        self.headers = {'X-API-Key': self.api_key.key}
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
+    POLLING_PLACE_ID = "test-pp-001"
+    SPARSE_POLLING_PLACE_ID = "test-pp-002"
+
+    @classmethod
+    def seed(cls):
+        """Seed the rows shared by every test in the class."""
+        # A fully populated polling place and one with the optional fields left null
+        db.session.execute(PollingPlace.__table__.insert(), [
+            {
+                'id': cls.POLLING_PLACE_ID,
+                'name': "Test Polling Place",
+                'address_line1': "123 Main St",
+                'city': "Test City",
+                'state': "VA",
+                'zip_code': "12345",
+                'county': "Test County",
+                'latitude': 37.7749,
+                'longitude': -122.4194,
+                'polling_hours': "7:00 AM - 8:00 PM",
+                'voter_services': "Parking, Accessibility",
+                'source_plugin': "test",
+            },
+            {
+                'id': cls.SPARSE_POLLING_PLACE_ID,
+                'name': "Test Place 2",
+                'address_line1': "456 Oak St",
+                'city': "Test City",
+                'state': "VA",
+                'zip_code': "12345",
+                'county': None,
+                'latitude': None,
+                'longitude': None,
+                'polling_hours': None,
+                'voter_services': None,
+                'source_plugin': "test",
+            },
+        ])
 
     def test_single_polling_place_vip_format(self):
         """Test single polling place endpoint in VIP format."""
-        response = self.client.get(f'/api/polling-places/{self.polling_place.id}?format=vip',
+        response = self.client.get(f'/api/polling-places/{self.POLLING_PLACE_ID}?format=vip',
                                  headers=self.headers)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         
         # Check VIP format structure
         self.assertIn('id', response_data)
@@ -461,23 +422,10 @@ class TestVIPFormatResponses(unittest.TestCase):
 
     def test_vip_format_excludes_null_values(self):
         """Test that VIP format excludes null values."""
-        # Create polling place with some null values
-        pp_with_nulls = PollingPlace()
-        pp_with_nulls.id = "test-pp-002"
-        pp_with_nulls.name = "Test Place 2"
-        pp_with_nulls.address_line1 = "456 Oak St"
-        pp_with_nulls.city = "Test City"
-        pp_with_nulls.state = "VA"
-        pp_with_nulls.zip_code = "12345"
-        # Leave some fields as None
-        pp_with_nulls.source_plugin = "test"
-        db.session.add(pp_with_nulls)
-        db.session.commit()
-        
-        response = self.client.get(f'/api/polling-places/{pp_with_nulls.id}?format=vip',
+        response = self.client.get(f'/api/polling-places/{self.SPARSE_POLLING_PLACE_ID}?format=vip',
                                  headers=self.headers)
         
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         
         # Null values should be excluded
         self.assertNotIn('county', response_data)
@@ -485,56 +433,34 @@ class TestVIPFormatResponses(unittest.TestCase):
         self.assertNotIn('voterServices', response_data)
 
 
-class TestBulkOperations(unittest.TestCase):
+class TestBulkOperations(_ComprehensiveAPITestBase):
     """Test bulk operation endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create test API key
-        self.api_key = APIKey()
-        self.api_key.key = "test-key-12345"
-        self.api_key.name = "Test Key"
-        self.api_key.is_active = True
-        db.session.add(self.api_key)
-        
-        # Create test data
-        for i in range(5):
-            pp = PollingPlace()
-            pp.id = f"test-pp-{i:03d}"
-            pp.name = f"Test Polling Place {i}"
-            pp.address_line1 = f"{i} Main St"
-            pp.city = "Test City"
-            pp.state = "VA"
-            pp.zip_code = "12345"
-            pp.source_plugin = "test"
-            db.session.add(pp)
-        
-        for i in range(3):
-            precinct = Precinct()
-            precinct.id = f"test-precinct-{i:03d}"
-            precinct.name = f"Test Precinct {i}"
-            precinct.state = "VA"
-            precinct.source_plugin = "test"
-            db.session.add(precinct)
-        
-        db.session.commit()
-        self.headers = {'X-API-Key': self.api_key.key}
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
+    @classmethod
+    def seed(cls):
+        """Seed the rows shared by every test in the class."""
+        # Create test data, one INSERT per table
+        db.session.execute(PollingPlace.__table__.insert(), [
+            {
+                'id': f"test-pp-{i:03d}",
+                'name': f"Test Polling Place {i}",
+                'address_line1': f"{i} Main St",
+                'city': "Test City",
+                'state': "VA",
+                'zip_code': "12345",
+                'source_plugin': "test",
+            }
+            for i in range(5)
+        ])
+        db.session.execute(Precinct.__table__.insert(), [
+            {
+                'id': f"test-precinct-{i:03d}",
+                'name': f"Test Precinct {i}",
+                'state': "VA",
+                'source_plugin': "test",
+            }
+            for i in range(3)
+        ])
 
     def test_bulk_delete_dry_run(self):
         """Test bulk delete dry run."""
@@ -546,11 +472,10 @@ class TestBulkOperations(unittest.TestCase):
         
         response = self.client.post('/api/bulk-delete',
                                   headers=self.headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  json=data)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertTrue(response_data['dry_run'])
         self.assertEqual(response_data['results']['polling_places']['count'], 5)
         
@@ -568,11 +493,10 @@ class TestBulkOperations(unittest.TestCase):
         
         response = self.client.post('/api/bulk-delete',
                                   headers=self.headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  json=data)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertFalse(response_data['dry_run'])
         self.assertEqual(response_data['results']['polling_places'], 5)
         
@@ -590,11 +514,10 @@ class TestBulkOperations(unittest.TestCase):
         
         response = self.client.post('/api/bulk-delete',
                                   headers=self.headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  json=data)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertEqual(response_data['results']['polling_places']['count'], 5)
         self.assertEqual(response_data['results']['precincts']['count'], 3)
 
@@ -608,65 +531,32 @@ class TestBulkOperations(unittest.TestCase):
         
         response = self.client.post('/api/bulk-delete',
                                   headers=self.headers,
-                                  data=json.dumps(data),
-                                  content_type='application/json')
+                                  json=data)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertEqual(response_data['total_count'], 0)
         self.assertIn('No records match', response_data['message'])
 
 
-class TestElectionEndpoints(unittest.TestCase):
+class TestElectionEndpoints(_ComprehensiveAPITestBase):
     """Test election-related endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = app
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.client = self.app.test_client()
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-        
-        # Create database tables
-        db.create_all()
-        
-        # Create test API key
-        self.api_key = APIKey()
-        self.api_key.key = "test-key-12345"
-        self.api_key.name = "Test Key"
-        self.api_key.is_active = True
-        db.session.add(self.api_key)
-        
-        # Create test elections
-        election1 = Election()
-        election1.date = date(2024, 11, 5)
-        election1.name = "2024 General Election"
-        election1.state = "VA"
-        db.session.add(election1)
-        
-        election2 = Election()
-        election2.date = date(2024, 3, 5)
-        election2.name = "2024 Presidential Primary"
-        election2.state = "VA"
-        db.session.add(election2)
-        
-        db.session.commit()
-        self.headers = {'X-API-Key': self.api_key.key}
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        db.session.remove()
-        db.drop_all()
-        self.ctx.pop()
+    @classmethod
+    def seed(cls):
+        """Seed the rows shared by every test in the class."""
+        # Create test elections in one INSERT
+        db.session.execute(Election.__table__.insert(), [
+            {'date': date(2024, 11, 5), 'name': "2024 General Election", 'state': "VA"},
+            {'date': date(2024, 3, 5), 'name': "2024 Presidential Primary", 'state': "VA"},
+        ])
 
     def test_list_elections(self):
         """Test listing all elections."""
         response = self.client.get('/api/elections', headers=self.headers)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertIn('elections', response_data)
         self.assertEqual(len(response_data['elections']), 2)
 
@@ -675,7 +565,7 @@ class TestElectionEndpoints(unittest.TestCase):
         response = self.client.get('/api/elections?state=VA', headers=self.headers)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertEqual(len(response_data['elections']), 2)
         
         # All returned elections should be from VA
@@ -687,7 +577,7 @@ class TestElectionEndpoints(unittest.TestCase):
         response = self.client.get('/api/elections?year=2024', headers=self.headers)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertEqual(len(response_data['elections']), 2)
 
     def test_get_single_election(self):
@@ -696,42 +586,10 @@ class TestElectionEndpoints(unittest.TestCase):
         response = self.client.get(f'/api/elections/{election.id}', headers=self.headers)
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.data)
+        response_data = response.get_json()
         self.assertEqual(response_data['id'], election.id)
         self.assertEqual(response_data['name'], election.name)
 
-    def test_get_nonexistent_election(self):
-        """Test getting non-existent election."""
-        response = self.client.get('/api/elections/999999', headers=self.headers)
-        self.assertEqual(response.status_code, 404)
-
 
 if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [
-        TestAuthenticationScenarios,
-        TestRateLimiting,
-        TestDataValidation,
-        TestErrorHandling,
-        TestVIPFormatResponses,
-        TestBulkOperations,
-        TestElectionEndpoints
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Print summary
-    print(f"\nTest Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
\ No newline at end of file
+    pytest.main([__file__, '-x', '-q'])
@@ -9,530 +9,477 @@ Includes unit tests, integration tests, and data validation tests for:
 - Error scenarios and edge cases
 """
 
+import hashlib
+import importlib.util
+import json
 import pytest
-import unittest
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import Mock, MagicMock, call
 import random
-
-# Import plugin and models
-import sys
+import re
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Dict, List
+import numpy as np
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import sys
 
+# A direct run puts tests/ rather than the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import plugin and models
 from plugins.dummy import DummyPlugin
 from models import PollingPlace, Precinct
 
+VALID_LOCATION_TYPES = {'drop box', 'early voting', 'election day'}
+
+# Expected formats, compiled once
+HOURS_RE = re.compile(r'\d+:\d+ [AP]M - \d+:\d+ [AP]M')
+PRECINCT_RE = {state: re.compile(rf'{state}-P-\d{{6}}') for state in DummyPlugin.STATES}
+
+# Polling places per state, and precincts per polling place, in the shared datasets
+FAKE_COUNT = 5
+
+
+def _digest(records):
+    """Hash records in a canonical order so two datasets compare in one step."""
+    canonical = json.dumps(sorted(records, key=lambda record: record['id']), sort_keys=True)
+    return hashlib.blake2b(canonical.encode()).digest()
+
+
+def _fake_db(existing_precincts=()):
+    """Stand-in for db with only the query().all() call fetch_precincts makes."""
+    query = SimpleNamespace(all=lambda: list(existing_precincts))
+    return SimpleNamespace(session=SimpleNamespace(query=lambda model: query))
+
+
+class DBError(RuntimeError):
+    """Error raised by the failing fake database."""
+
+
+def _failing_query(model):
+    """Fake session.query that fails like an unreachable database."""
+    raise DBError("Database error")
+
+
+def _make_plugin(db=None):
+    """Build a DummyPlugin on a mock app and, by default, an empty fake database."""
+    mock_app = Mock()
+    mock_app.logger = Mock()
+    return DummyPlugin(mock_app, db if db is not None else _fake_db())
+
+
+@pytest.fixture(scope="module")
+def plugin():
+    """Plugin shared by the module; tests only patch it within their own scope."""
+    return _make_plugin()
+
+
+@pytest.fixture
+def fresh_plugin():
+    """Plugin for tests that change its attributes."""
+    return _make_plugin()
+
+
+@pytest.fixture
+def fake_db_with_precincts():
+    """Fake database already holding one Ohio precinct."""
+    return _fake_db([SimpleNamespace(id='OH-P-000001', current_polling_place_id='OH-00001')])
 
-class TestDummyDataGeneration(unittest.TestCase):
-    """Unit tests for Dummy plugin's data generation functionality."""
 
-    def setUp(self):
-        """Set up test fixtures with mock app and database."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.mock_db.session = Mock()
-        self.plugin = DummyPlugin(self.mock_app, self.mock_db)
+@pytest.fixture
+def fixed_randint(monkeypatch):
+    """Pin random.randint to one value for the rest of the test: ``fixed_randint(5)``."""
+    def fix(value):
+        monkeypatch.setattr('plugins.dummy.random.randint', lambda a, b: value)
+    return fix
 
-    def test_plugin_properties(self):
+
+@pytest.fixture(scope="module")
+def polling_places():
+    """Polling places generated once, FAKE_COUNT per state, all passing validation."""
+    generator = _make_plugin()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('plugins.dummy.random.randint', lambda a, b: FAKE_COUNT)
+        mp.setattr(generator, 'validate_polling_place_data', lambda location: True)
+        return generator.fetch_polling_places()
+
+
+@pytest.fixture(scope="module")
+def polling_places_by_state(polling_places):
+    """The shared polling places grouped by state, in generation order."""
+    by_state: Dict[str, List[Dict[str, Any]]] = {}
+    for location in polling_places:
+        by_state.setdefault(location['state'], []).append(location)
+    return by_state
+
+
+@pytest.fixture(scope="module")
+def precincts():
+    """Precincts generated once against an empty database, FAKE_COUNT per polling place."""
+    generator = _make_plugin()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('plugins.dummy.random.randint', lambda a, b: FAKE_COUNT)
+        return generator.fetch_precincts()
+
+
+@pytest.fixture(scope="module")
+def location_type_sample(plugin):
+    """10000 location types drawn in one batch and shared by the type tests."""
+    return plugin.sample_location_types(10000)
+
+
+@pytest.fixture(scope="module")
+def coordinate_sample(plugin):
+    """1000 coordinate pairs drawn in one batch and shared by the bounds tests."""
+    return plugin.generate_fake_coordinates_batch(1000)
+
+
+class TestDummyDataGeneration:
+    """Unit tests for Dummy plugin's data generation functionality."""
+
+    def test_plugin_properties(self, plugin):
         """Test plugin property values."""
-        self.assertEqual(self.plugin.name, 'dummy')
-        self.assertEqual(self.plugin.state_code, 'ALL')
-        self.assertEqual(self.plugin.description, 'Dummy plugin that generates fake polling place data for testing (all states)')
+        assert plugin.name == 'dummy'
+        assert plugin.state_code == 'ALL'
+        assert plugin.description == 'Dummy plugin that generates fake polling place data for testing (all states)'
 
-    def test_generate_fake_city(self):
+    def test_generate_fake_city(self, plugin):
         """Test fake city name generation."""
-        city = self.plugin.generate_fake_city()
+        city = plugin.generate_fake_city()
         
         # Should be a combination of prefix and suffix
-        self.assertIsInstance(city, str)
-        self.assertTrue(len(city) > 0)
+        assert isinstance(city, str)
+        assert len(city) > 0
         
         # Should contain one of the prefixes and suffixes
-        prefixes = self.plugin.CITY_PREFIXES
-        suffixes = self.plugin.CITY_SUFFIXES
+        has_prefix = any(city.startswith(prefix) for prefix in plugin.CITY_PREFIXES)
+        has_suffix = any(city.endswith(suffix) for suffix in plugin.CITY_SUFFIXES)
         
-        has_prefix = any(city.startswith(prefix) for prefix in prefixes)
-        has_suffix = any(city.endswith(suffix) for suffix in suffixes)
-        
-        self.assertTrue(has_prefix or has_suffix)
+        assert has_prefix or has_suffix
 
-    def test_generate_fake_address(self):
+    def test_generate_fake_address(self, plugin):
         """Test fake address generation."""
-        address = self.plugin.generate_fake_address()
+        address = plugin.generate_fake_address()
         
         # Should be in format "number street_name"
-        self.assertIsInstance(address, str)
+        assert isinstance(address, str)
         parts = address.split(' ', 1)
-        self.assertEqual(len(parts), 2)
+        assert len(parts) == 2
         
         number, street = parts
-        self.assertTrue(number.isdigit())
-        self.assertIn(street, self.plugin.STREET_NAMES)
+        assert number.isdigit()
+        assert street in plugin.STREET_NAMES
 
-    def test_generate_fake_coordinates(self):
+    def test_generate_fake_coordinates(self, plugin):
         """Test fake coordinate generation within US bounds."""
-        lat, lng = self.plugin.generate_fake_coordinates()
+        lat, lng = plugin.generate_fake_coordinates()
         
         # Check types
-        self.assertIsInstance(lat, float)
-        self.assertIsInstance(lng, float)
+        assert isinstance(lat, float)
+        assert isinstance(lng, float)
         
         # Check US bounds (continental)
-        self.assertGreaterEqual(lat, 24.5)
-        self.assertLessEqual(lat, 49.4)
-        self.assertGreaterEqual(lng, -125.0)
-        self.assertLessEqual(lng, -66.0)
+        assert 24.5 <= lat <= 49.4
+        assert -125.0 <= lng <= -66.0
 
-    def test_generate_fake_polling_hours(self):
+    def test_generate_fake_polling_hours(self, plugin):
         """Test fake polling hours generation."""
-        hours = self.plugin.generate_fake_polling_hours()
+        hours = plugin.generate_fake_polling_hours()
         
         # Should be in expected format
-        self.assertIsInstance(hours, str)
-        self.assertRegex(hours, r'\d+:\d+ [AP]M - \d+:\d+ [AP]M')
-
-    def test_generate_fake_location_type(self):
-        """Test fake location type generation with distribution."""
-        # Test multiple generations to check distribution
-        types = []
-        for _ in range(1000):
-            types.append(self.plugin.generate_fake_location_type())
-        
-        # Should only return valid types
-        valid_types = {'drop box', 'early voting', 'election day'}
-        self.assertTrue(all(t in valid_types for t in types))
-        
-        # Check approximate distribution (80% election day, 15% early voting, 5% drop box)
-        election_day_count = types.count('election day')
-        early_voting_count = types.count('early voting')
-        drop_box_count = types.count('drop box')
-        
-        self.assertGreater(election_day_count, 700)  # ~80%
-        self.assertGreater(early_voting_count, 100)   # ~15%
-        self.assertGreater(drop_box_count, 30)        # ~5%
-
-    def test_generate_fake_location_complete(self):
+        assert isinstance(hours, str)
+        assert HOURS_RE.match(hours)
+
+    def test_generate_fake_location_type(self, plugin):
+        """Test fake location types are always one of the valid types."""
+        types = {plugin.generate_fake_location_type() for _ in range(100)}
+        assert types <= VALID_LOCATION_TYPES
+
+    def test_sample_location_types(self, location_type_sample):
+        """Test batched location types are valid and sized as requested."""
+        assert len(location_type_sample) == 10000
+        assert set(location_type_sample) <= VALID_LOCATION_TYPES
+
+    def test_location_type_distribution(self, plugin, location_type_sample):
+        """Test fake location types follow the weighted distribution."""
+        counts = Counter(location_type_sample)
+        shares = [counts[t] / len(location_type_sample) for t in plugin.FAKE_LOCATION_TYPES]
+        
+        # Approximately 5% drop box, 15% early voting, 80% election day;
+        # 1.5 points is over four standard deviations at this sample size
+        assert shares == pytest.approx(plugin.FAKE_LOCATION_TYPE_WEIGHTS, abs=0.015)
+
+    def test_generate_fake_location_complete(self, plugin):
         """Test complete fake location generation."""
-        location = self.plugin.generate_fake_location('OH', 1)
+        location = plugin.generate_fake_location('OH', 1)
         
         # Check required fields
         required_fields = ['id', 'name', 'address_line1', 'city', 'state', 'zip_code', 'latitude', 'longitude', 'location_type']
         for field in required_fields:
-            self.assertIn(field, location)
+            assert field in location
         
         # Check field types and values
-        self.assertEqual(location['id'], 'OH-00001')
-        self.assertEqual(location['state'], 'OH')
-        self.assertIsInstance(location['name'], str)
-        self.assertIsInstance(location['address_line1'], str)
-        self.assertIsInstance(location['city'], str)
-        self.assertIsInstance(location['zip_code'], str)
-        self.assertIsInstance(location['latitude'], float)
-        self.assertIsInstance(location['longitude'], float)
-        self.assertIn(location['location_type'], ['drop box', 'early voting', 'election day'])
-
-    def test_generate_fake_location_optional_fields(self):
+        assert location['id'] == 'OH-00001'
+        assert location['state'] == 'OH'
+        assert isinstance(location['name'], str)
+        assert isinstance(location['address_line1'], str)
+        assert isinstance(location['city'], str)
+        assert isinstance(location['zip_code'], str)
+        assert isinstance(location['latitude'], float)
+        assert isinstance(location['longitude'], float)
+        assert location['location_type'] in VALID_LOCATION_TYPES
+
+    def test_generate_fake_location_optional_fields(self, plugin):
         """Test optional fields in fake location generation."""
-        # Test multiple generations to check optional fields
-        locations = [self.plugin.generate_fake_location('OH', i) for i in range(100)]
+        # Generate until every optional field has appeared, within 100 locations
+        missing = {'location_name', 'notes', 'voter_services'}
+        for i in range(100):
+            missing -= plugin.generate_fake_location('OH', i).keys()
+            if not missing:
+                break
         
         # Check optional fields appear randomly
-        has_location_name = any('location_name' in loc for loc in locations)
-        has_notes = any('notes' in loc for loc in locations)
-        has_services = any('voter_services' in loc for loc in locations)
-        
-        self.assertTrue(has_location_name)
-        self.assertTrue(has_notes)
-        self.assertTrue(has_services)
+        assert not missing
 
-    def test_states_coverage(self):
+    def test_states_coverage(self, plugin):
         """Test that all US states are covered."""
-        self.assertEqual(len(self.plugin.STATES), 50)
-        
-        # Check some known states
-        known_states = ['CA', 'TX', 'NY', 'FL', 'OH', 'IL']
-        for state in known_states:
-            self.assertIn(state, self.plugin.STATES)
-            self.assertIsInstance(self.plugin.STATES[state], str)
+        assert len(plugin.STATES) == 50
 
+    @pytest.mark.parametrize("state", ['CA', 'TX', 'NY', 'FL', 'OH', 'IL'])
+    def test_known_state(self, plugin, state):
+        """Test that a known state is covered with its name."""
+        assert state in plugin.STATES
+        assert isinstance(plugin.STATES[state], str)
 
-class TestDummyPollingPlaces(unittest.TestCase):
-    """Unit tests for Dummy plugin's polling place generation."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.mock_db.session = Mock()
-        self.plugin = DummyPlugin(self.mock_app, self.mock_db)
+class TestDummyPollingPlaces:
+    """Unit tests for Dummy plugin's polling place generation."""
 
-    @patch('plugins.dummy.random.randint')
-    def test_fetch_polling_places_count(self, mock_randint):
+    def test_fetch_polling_places_count(self, plugin, fixed_randint, monkeypatch):
         """Test polling place count generation."""
-        mock_randint.return_value = 105  # Fixed number for testing
+        fixed_randint(105)  # Fixed number for testing
+        mock_generate = Mock(return_value={'id': 'test'})
+        monkeypatch.setattr(plugin, 'generate_fake_location', mock_generate)
         
-        with patch.object(self.plugin, 'generate_fake_location') as mock_generate:
-            mock_generate.return_value = {'id': 'test'}
-            
-            result = self.plugin.fetch_polling_places()
-            
-            # Should generate for all 50 states
-            self.assertEqual(mock_generate.call_count, 50)
-            self.assertEqual(len(result), 50 * 105)  # 50 states * 105 locations each
+        result = plugin.fetch_polling_places()
+        
+        # Should generate for all 50 states
+        assert mock_generate.call_count == 50
+        assert len(result) == 50 * 105  # 50 states * 105 locations each
 
-    @patch('plugins.dummy.random.randint')
-    def test_fetch_polling_places_validation(self, mock_randint):
+    def test_fetch_polling_places_validation(self, plugin, fixed_randint, monkeypatch):
         """Test that generated polling places pass validation."""
-        mock_randint.return_value = 2  # Small number for testing
+        fixed_randint(2)  # Small number for testing
+        monkeypatch.setattr(plugin, 'validate_polling_place_data', lambda location: True)
         
-        with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-            result = self.plugin.fetch_polling_places()
-            
-            # Should generate 2 locations per state = 100 total
-            self.assertEqual(len(result), 100)
+        result = plugin.fetch_polling_places()
+        
+        # Should generate 2 locations per state = 100 total
+        assert len(result) == 100
 
-    @patch('plugins.dummy.random.randint')
-    def test_fetch_polling_places_invalid_data(self, mock_randint):
+    def test_fetch_polling_places_invalid_data(self, plugin, fixed_randint, monkeypatch):
         """Test handling of invalid generated data."""
-        mock_randint.return_value = 2
+        fixed_randint(2)
         
-        # Mock validation to fail for some locations
-        def mock_validate(location):
-            return location['id'] != 'invalid-id'
+        # First location valid, second invalid
+        mock_generate = Mock(side_effect=[
+            {'id': 'valid-id'},
+            {'id': 'invalid-id'}
+        ])
+        monkeypatch.setattr(plugin, 'generate_fake_location', mock_generate)
+        # Validation fails for the invalid location
+        monkeypatch.setattr(plugin, 'validate_polling_place_data', lambda location: location['id'] != 'invalid-id')
         
-        with patch.object(self.plugin, 'generate_fake_location') as mock_generate, \
-             patch.object(self.plugin, 'validate_polling_place_data', side_effect=mock_validate):
-            
-            # First location valid, second invalid
-            mock_generate.side_effect = [
-                {'id': 'valid-id'},
-                {'id': 'invalid-id'}
-            ]
-            
-            result = self.plugin.fetch_polling_places()
-            
-            # Should only include valid locations
-            valid_locations = [loc for loc in result if loc['id'] == 'valid-id']
-            self.assertEqual(len(valid_locations), 50)  # One valid per state
+        result = plugin.fetch_polling_places()
+        
+        # Should only include valid locations
+        valid_locations = [loc for loc in result if loc['id'] == 'valid-id']
+        assert len(valid_locations) == 50  # One valid per state
 
-    def test_fetch_polling_places_id_format(self):
+    def test_fetch_polling_places_id_format(self, plugin, polling_places_by_state):
         """Test polling place ID format across states."""
-        with patch('plugins.dummy.random.randint', return_value=1):
-            with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-                result = self.plugin.fetch_polling_places()
-                
-                # Check ID format for each state
-                for state_code in self.plugin.STATES.keys():
-                    state_locations = [loc for loc in result if loc['state'] == state_code]
-                    self.assertEqual(len(state_locations), 1)
-                    
-                    location = state_locations[0]
-                    expected_id = f"{state_code}-00001"
-                    self.assertEqual(location['id'], expected_id)
-
-    def test_fetch_polling_places_geographic_distribution(self):
+        # Check ID format for each state
+        for state_code in plugin.STATES:
+            state_locations = polling_places_by_state[state_code]
+            assert len(state_locations) == FAKE_COUNT
+            
+            location = state_locations[0]
+            expected_id = f"{state_code}-00001"
+            assert location['id'] == expected_id
+
+    def test_fetch_polling_places_geographic_distribution(self, polling_places):
         """Test geographic distribution of generated polling places."""
-        with patch('plugins.dummy.random.randint', return_value=10):
-            with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-                result = self.plugin.fetch_polling_places()
-                
-                # Should have locations for all states
-                states_represented = set(loc['state'] for loc in result)
-                self.assertEqual(len(states_represented), 50)
-                
-                # Check coordinates are within bounds
-                for location in result:
-                    lat = location['latitude']
-                    lng = location['longitude']
-                    self.assertGreaterEqual(lat, 24.5)
-                    self.assertLessEqual(lat, 49.4)
-                    self.assertGreaterEqual(lng, -125.0)
-                    self.assertLessEqual(lng, -66.0)
-
-
-class TestDummyPrecincts(unittest.TestCase):
-    """Unit tests for Dummy plugin's precinct generation."""
+        # Should have locations for all states
+        states_represented = set(loc['state'] for loc in polling_places)
+        assert len(states_represented) == 50
+        
+        # Check coordinates are within bounds
+        lats = np.fromiter((loc['latitude'] for loc in polling_places), dtype=np.float64)
+        lngs = np.fromiter((loc['longitude'] for loc in polling_places), dtype=np.float64)
+        assert lats.min() >= 24.5 and lats.max() <= 49.4
+        assert lngs.min() >= -125.0 and lngs.max() <= -66.0
+
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.mock_db.session = Mock()
-        self.plugin = DummyPlugin(self.mock_app, self.mock_db)
+class TestDummyPrecincts:
+    """Unit tests for Dummy plugin's precinct generation."""
 
-    @patch('plugins.dummy.random.randint')
-    def test_fetch_precincts_count(self, mock_randint):
+    def test_fetch_precincts_count(self, precincts):
         """Test precinct count generation."""
-        mock_randint.return_value = 5  # 5 precincts per polling place
-        
-        # Mock no existing precincts
-        self.mock_db.session.query.return_value.all.return_value = []
-        
-        result = self.plugin.fetch_precincts()
-        
         # Should generate 5 precincts per polling place per state
         # 50 states * 5 polling places * 5 precincts = 1250 total
-        expected_count = 50 * 5 * 5
-        self.assertEqual(len(result), expected_count)
+        expected_count = 50 * FAKE_COUNT * FAKE_COUNT
+        assert len(precincts) == expected_count
 
-    @patch('plugins.dummy.random.randint')
-    def test_fetch_precincts_existing_data(self, mock_randint):
+    def test_fetch_precincts_existing_data(self, fake_db_with_precincts, fixed_randint, monkeypatch):
         """Test precinct generation with existing data."""
-        mock_randint.return_value = 3
-        
-        # Mock existing precincts
-        mock_existing_precinct = Mock()
-        mock_existing_precinct.id = 'OH-P-000001'
-        mock_existing_precinct.current_polling_place_id = 'OH-00001'
+        fixed_randint(3)
+        plugin = _make_plugin(fake_db_with_precincts)
         
-        self.mock_db.session.query.return_value.all.return_value = [mock_existing_precinct]
+        monkeypatch.setattr('plugins.dummy.random.random', lambda: 0.05)  # Below 10% threshold
+        result = plugin.fetch_precincts()
         
-        with patch('plugins.dummy.random.random', return_value=0.05):  # Below 10% threshold
-            result = self.plugin.fetch_precincts()
-            
-            # Should handle existing precincts
-            self.assertGreater(len(result), 0)
+        # Should handle existing precincts
+        assert len(result) > 0
 
-    @patch('plugins.dummy.random.randint')
-    @patch('plugins.dummy.random.random')
-    def test_fetch_precincts_reassignment(self, mock_random, mock_randint):
+    def test_fetch_precincts_reassignment(self, fake_db_with_precincts, fixed_randint, monkeypatch):
         """Test precinct reassignment logic."""
-        mock_randint.return_value = 2
-        mock_random.return_value = 0.15  # Above 10% threshold, triggers reassignment
-        
-        # Mock existing precincts
-        mock_existing_precinct = Mock()
-        mock_existing_precinct.id = 'OH-P-000001'
-        mock_existing_precinct.current_polling_place_id = 'OH-00001'
-        
-        self.mock_db.session.query.return_value.all.return_value = [mock_existing_precinct]
+        fixed_randint(2)
+        monkeypatch.setattr('plugins.dummy.random.random', lambda: 0.15)  # Above 10% threshold, triggers reassignment
+        plugin = _make_plugin(fake_db_with_precincts)
         
-        result = self.plugin.fetch_precincts()
+        result = plugin.fetch_precincts()
         
         # Should have reassigned some precincts
-        self.assertGreater(len(result), 0)
+        assert len(result) > 0
 
-    def test_fetch_precincts_id_format(self):
+    def test_fetch_precincts_id_format(self, precincts):
         """Test precinct ID format."""
-        with patch('plugins.dummy.random.randint', return_value=1):
-            self.mock_db.session.query.return_value.all.return_value = []
-            
-            result = self.plugin.fetch_precincts()
-            
-            # Check ID format: {state}-P-{######}
-            for precinct in result[:10]:  # Check first 10
-                precinct_id = precinct['id']
-                state = precinct['state']
-                self.assertRegex(precinct_id, rf'{state}-P-\d{{6}}')
+        # Check ID format: {state}-P-{######}
+        for precinct in precincts[:10]:  # Check first 10
+            assert PRECINCT_RE[precinct['state']].match(precinct['id'])
 
-    def test_fetch_precincts_polling_place_linking(self):
+    def test_fetch_precincts_polling_place_linking(self, precincts):
         """Test that precincts are properly linked to polling places."""
-        with patch('plugins.dummy.random.randint', return_value=2):
-            self.mock_db.session.query.return_value.all.return_value = []
-            
-            result = self.plugin.fetch_precincts()
+        # All precincts should have polling_place_id
+        for precinct in precincts:
+            assert 'polling_place_id' in precinct
+            assert isinstance(precinct['polling_place_id'], str)
             
-            # All precincts should have polling_place_id
-            for precinct in result:
-                self.assertIn('polling_place_id', precinct)
-                self.assertIsInstance(precinct['polling_place_id'], str)
-                
-                # Polling place ID should match state
-                self.assertTrue(precinct['polling_place_id'].startswith(precinct['state']))
-
-    def test_fetch_precincts_data_completeness(self):
+            # Polling place ID should match state
+            assert precinct['polling_place_id'].startswith(precinct['state'])
+
+    def test_fetch_precincts_data_completeness(self, precincts):
         """Test completeness of generated precinct data."""
-        with patch('plugins.dummy.random.randint', return_value=1):
-            self.mock_db.session.query.return_value.all.return_value = []
-            
-            result = self.plugin.fetch_precincts()
-            
-            # Check required fields
-            required_fields = ['id', 'name', 'state', 'county', 'polling_place_id']
-            for precinct in result:
-                for field in required_fields:
-                    self.assertIn(field, precinct)
-                    self.assertIsNotNone(precinct[field])
+        # Check required fields
+        required_fields = ['id', 'name', 'state', 'county', 'polling_place_id']
+        for precinct in precincts:
+            for field in required_fields:
+                assert field in precinct
+                assert precinct[field] is not None
 
 
-class TestDummyErrorScenarios(unittest.TestCase):
+class TestDummyErrorScenarios:
     """Error scenario tests for Dummy plugin."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.mock_db.session = Mock()
-        self.plugin = DummyPlugin(self.mock_app, self.mock_db)
-
-    def test_validation_failure_handling(self):
+    def test_validation_failure_handling(self, plugin, monkeypatch):
         """Test handling of validation failures."""
-        with patch.object(self.plugin, 'validate_polling_place_data', return_value=False):
-            result = self.plugin.fetch_polling_places()
-            
-            # Should return empty list if all validations fail
-            self.assertEqual(len(result), 0)
+        monkeypatch.setattr(plugin, 'validate_polling_place_data', lambda location: False)
+        
+        result = plugin.fetch_polling_places()
+        
+        # Should return empty list if all validations fail
+        assert len(result) == 0
 
     def test_database_error_handling(self):
-        """Test handling of database errors."""
-        # Mock database to raise an exception
-        self.mock_db.session.query.side_effect = Exception("Database error")
+        """Test that database errors propagate out of fetch_precincts."""
+        plugin = _make_plugin(SimpleNamespace(session=SimpleNamespace(query=_failing_query)))
         
-        with self.assertRaises(Exception):
-            self.plugin.fetch_precincts()
+        with pytest.raises(DBError, match="Database error"):
+            plugin.fetch_precincts()
 
-    def test_random_generation_edge_cases(self):
+    def test_random_generation_edge_cases(self, plugin, fixed_randint, monkeypatch):
         """Test edge cases in random generation."""
         # Test with minimum values
-        with patch('plugins.dummy.random.randint', return_value=100):
-            with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-                result = self.plugin.fetch_polling_places()
-                
-                # Should still generate valid data
-                self.assertEqual(len(result), 50 * 100)  # 50 states * 100 locations
-
-    def test_coordinate_bounds_validation(self):
+        fixed_randint(100)
+        monkeypatch.setattr(plugin, 'validate_polling_place_data', lambda location: True)
+        
+        result = plugin.fetch_polling_places()
+        
+        # Should still generate valid data
+        assert len(result) == 50 * 100  # 50 states * 100 locations
+
+    def test_coordinate_bounds_validation(self, coordinate_sample):
         """Test coordinate generation stays within bounds."""
-        # Generate many coordinates to test bounds
-        for _ in range(1000):
-            lat, lng = self.plugin.generate_fake_coordinates()
-            
-            self.assertGreaterEqual(lat, 24.5)
-            self.assertLessEqual(lat, 49.4)
-            self.assertGreaterEqual(lng, -125.0)
-            self.assertLessEqual(lng, -66.0)
+        assert coordinate_sample.shape == (1000, 2)
+        lats, lngs = coordinate_sample[:, 0], coordinate_sample[:, 1]
+        assert lats.min() >= 24.5 and lats.max() <= 49.4
+        assert lngs.min() >= -125.0 and lngs.max() <= -66.0
 
-    def test_empty_states_handling(self):
+    def test_empty_states_handling(self, fresh_plugin):
         """Test handling when states dictionary is empty."""
-        original_states = self.plugin.STATES
-        self.plugin.STATES = {}
+        fresh_plugin.STATES = {}
         
-        try:
-            result = self.plugin.fetch_polling_places()
-            self.assertEqual(len(result), 0)
-        finally:
-            self.plugin.STATES = original_states  # Restore
+        result = fresh_plugin.fetch_polling_places()
+        assert len(result) == 0
 
 
-class TestDummyIntegration(unittest.TestCase):
+class TestDummyIntegration:
     """Integration tests for Dummy plugin workflow."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_app = Mock()
-        self.mock_app.logger = Mock()
-        self.mock_db = Mock()
-        self.mock_db.session = Mock()
-        self.plugin = DummyPlugin(self.mock_app, self.mock_db)
-
-    def test_complete_workflow(self):
+    def test_complete_workflow(self, polling_places, precincts):
         """Test complete workflow from data generation to validation."""
-        with patch('plugins.dummy.random.randint', return_value=2):
-            with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-                # Test polling places
-                polling_places = self.plugin.fetch_polling_places()
-                self.assertEqual(len(polling_places), 100)  # 50 states * 2 locations
-                
-                # Test precincts
-                self.mock_db.session.query.return_value.all.return_value = []
-                precincts = self.plugin.fetch_precincts()
-                self.assertEqual(len(precincts), 200)  # 50 states * 2 locations * 2 precincts
-
-    def test_data_consistency(self):
+        # Test polling places
+        assert len(polling_places) == 50 * FAKE_COUNT
+        
+        # Test precincts
+        assert len(precincts) == 50 * FAKE_COUNT * FAKE_COUNT
+
+    def test_data_consistency(self, polling_places, precincts):
         """Test data consistency between polling places and precincts."""
-        with patch('plugins.dummy.random.randint', return_value=1):
-            with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-                polling_places = self.plugin.fetch_polling_places()
-                self.mock_db.session.query.return_value.all.return_value = []
-                precincts = self.plugin.fetch_precincts()
-                
-                # Check that all precinct polling place IDs exist in polling places
-                polling_place_ids = {pp['id'] for pp in polling_places}
-                for precinct in precincts:
-                    self.assertIn(precinct['polling_place_id'], polling_place_ids)
-
-    def test_state_distribution(self):
+        # Check that all precinct polling place IDs exist in polling places
+        polling_place_ids = {pp['id'] for pp in polling_places}
+        for precinct in precincts:
+            assert precinct['polling_place_id'] in polling_place_ids
+
+    def test_state_distribution(self, polling_places_by_state):
         """Test uniform distribution across states."""
-        with patch('plugins.dummy.random.randint', return_value=1):
-            with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-                result = self.plugin.fetch_polling_places()
-                
-                # Count locations per state
-                state_counts = {}
-                for location in result:
-                    state = location['state']
-                    state_counts[state] = state_counts.get(state, 0) + 1
-                
-                # Should have exactly 1 location per state
-                self.assertEqual(len(state_counts), 50)
-                for count in state_counts.values():
-                    self.assertEqual(count, 1)
-
-    def test_performance_with_large_dataset(self):
-        """Test performance with large dataset generation."""
-        import time
-        
-        start_time = time.time()
-        
-        with patch('plugins.dummy.random.randint', return_value=5):
-            with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-                result = self.plugin.fetch_polling_places()
-        
-        end_time = time.time()
-        generation_time = end_time - start_time
-        
-        # Should complete within reasonable time (5 seconds for 250 locations)
-        self.assertLess(generation_time, 5.0)
-        self.assertEqual(len(result), 250)  # 50 states * 5 locations
-
-    def test_reproducible_generation(self):
+        # Should have the same number of locations in every state
+        assert len(polling_places_by_state) == 50
+        for locations in polling_places_by_state.values():
+            assert len(locations) == FAKE_COUNT
+
+    def test_reproducible_generation(self, fresh_plugin, fixed_randint, monkeypatch):
         """Test that generation can be made reproducible."""
+        fixed_randint(1)
+        monkeypatch.setattr(fresh_plugin, 'validate_polling_place_data', lambda location: True)
+        
         # Set random seed for reproducible results
-        with patch('plugins.dummy.random.randint', return_value=1):
-            with patch.object(self.plugin, 'validate_polling_place_data', return_value=True):
-                result1 = self.plugin.fetch_polling_places()
-                result2 = self.plugin.fetch_polling_places()
-                
-                # Results should be identical with same parameters
-                self.assertEqual(len(result1), len(result2))
-                
-                # Sort by ID for comparison
-                result1_sorted = sorted(result1, key=lambda x: x['id'])
-                result2_sorted = sorted(result2, key=lambda x: x['id'])
-                
-                for loc1, loc2 in zip(result1_sorted, result2_sorted):
-                    self.assertEqual(loc1['id'], loc2['id'])
-                    self.assertEqual(loc1['state'], loc2['state'])
+        fresh_plugin.seed(1234)
+        result1 = fresh_plugin.fetch_polling_places()
+        fresh_plugin.seed(1234)
+        result2 = fresh_plugin.fetch_polling_places()
+        
+        # Results should be identical, field for field, with the same seed
+        assert len(result1) == len(result2)
+        assert _digest(result1) == _digest(result2)
 
 
-if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [
-        TestDummyDataGeneration,
-        TestDummyPollingPlaces,
-        TestDummyPrecincts,
-        TestDummyErrorScenarios,
-        TestDummyIntegration
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
+# Generator benchmark (pytest-benchmark). Save a baseline with
+# ``pytest tests/test_dummy_plugin.py --benchmark-only --benchmark-autosave``
+# and gate changes with ``--benchmark-compare --benchmark-compare-fail=mean:10%``;
+# skipped when the plugin is not installed.
+BENCHMARK_AVAILABLE = importlib.util.find_spec('pytest_benchmark') is not None
+requires_benchmark = pytest.mark.skipif(not BENCHMARK_AVAILABLE, reason="pytest-benchmark not installed")
+
+
+@requires_benchmark
+def test_benchmark_generate_fake_location(plugin, benchmark):
+    """Benchmark generating a single fake polling location."""
+    location = benchmark(plugin.generate_fake_location, 'OH', 1)
     
-    # Print summary
-    print(f"\nTest Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
\ No newline at end of file
+    assert location['id'] == 'OH-00001'
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-v']))
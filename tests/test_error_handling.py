@@ -5,6 +5,7 @@ Tests for structured logging, error tracking, graceful degradation,
 automated alerting, and error handling decorators.
 """
 
+import sys
 import unittest
 import time
 import json
@@ -15,6 +16,7 @@ from typing import Dict, Any
 
 # Import modules with fallback handling
 try:
+    import structured_logging
     from structured_logging import get_logger, log_performance, StructuredLogger
     STRUCTURED_LOGGING_AVAILABLE = True
 except ImportError:
@@ -84,6 +86,159 @@ class TestStructuredLogging(unittest.TestCase):
             # Check that the message contains structured data
             self.assertIn("Test message", str(args))
     
+    def test_log_line_serialized_once(self):
+        """Test context is emitted as top-level JSON fields, not an encoded string"""
+        import io
+        
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(structured_logging.JSON_FORMATTER)
+        
+        with patch.object(self.logger.logger, 'handlers', [handler]):
+            self.logger.info("Test message", action="test", name="reserved")
+        
+        entry = json.loads(stream.getvalue())
+        self.assertEqual(entry["message"], "Test message")
+        self.assertEqual(entry["action"], "test")
+        self.assertEqual(entry["name_"], "reserved")
+        self.assertEqual(entry["service"], "csc-pollingplace-api")
+    
+    def test_orjson_matches_stdlib_encoding(self):
+        """Test log lines decode to the same entry with and without orjson"""
+        if not structured_logging.ORJSON_AVAILABLE:
+            self.skipTest("orjson not available")
+        
+        record = self.logger.logger.makeRecord(
+            "test_logger", logging.INFO, __file__, 0, "Test message", (), None,
+            extra={"when": datetime(2024, 1, 1, 12, 0), "count": 3, "big": 2 ** 70, "ids": {1: "a"}}
+        )
+        
+        fast = structured_logging.JSON_FORMATTER.format(record)
+        with patch.object(structured_logging, 'ORJSON_AVAILABLE', False):
+            slow = structured_logging.JSON_FORMATTER.format(record)
+        
+        self.assertEqual(json.loads(fast), json.loads(slow))
+        self.assertEqual(json.loads(fast)["when"], "2024-01-01 12:00:00")
+    
+    def test_records_queued_with_structure(self):
+        """Test records reach the listener unflattened, with the traceback rendered"""
+        handler = self.logger.logger.handlers[0]
+        assert isinstance(handler, structured_logging.QueueHandler)
+        
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = self.logger.logger.makeRecord(
+                "test_logger", logging.ERROR, __file__, 0, "failed %s", ("op",),
+                sys.exc_info(), extra={"action": "test"}
+            )
+        
+        prepared = handler.prepare(record)
+        self.assertEqual(prepared.msg, "failed op")
+        self.assertEqual(prepared.action, "test")
+        self.assertIsNone(prepared.exc_info)
+        self.assertIn("ValueError: boom", prepared.exc_text)
+        
+        entry = json.loads(structured_logging.JSON_FORMATTER.format(prepared))
+        self.assertIn("ValueError: boom", entry["exc_info"])
+    
+    def test_request_lines_rendered_from_templates(self):
+        """Test request start/end lines are valid JSON with escaped values"""
+        import io
+        from flask import Flask
+        from structured_logging import RequestTracker
+        
+        app = Flask(__name__)
+        RequestTracker(app)
+        
+        @app.route('/ping')
+        def ping():
+            return 'pong'
+        
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(structured_logging.JSON_FORMATTER)
+        
+        with patch.object(get_logger().logger, 'handlers', [handler]):
+            app.test_client().get(
+                '/ping', headers={'X-Request-ID': 'id-"1"', 'User-Agent': 'tester/1.0'}
+            )
+        
+        start, end = [json.loads(line) for line in stream.getvalue().splitlines()]
+        datefmt = structured_logging.JSON_FORMATTER.datefmt
+        assert datefmt is not None
+        self.assertEqual(start["event_type"], "request_start")
+        self.assertEqual(start["request_id"], 'id-"1"')
+        for entry in (start, end):
+            self.assertNotIn("ts", entry)
+            datetime.strptime(entry["asctime"], datefmt)
+            self.assertEqual(entry["url"], "http://localhost/ping")
+            self.assertEqual(entry["user_agent"], "tester/1.0")
+            self.assertEqual(entry["remote_addr"], "127.0.0.1")
+            self.assertEqual(entry["version"], "1.0.0")
+        self.assertEqual(end["event_type"], "http_request")
+        self.assertEqual(end["status_code"], 200)
+        self.assertEqual(end["path"], "/ping")
+        self.assertEqual(end["response_size"], 4)
+    
+    def test_static_requests_not_tracked(self):
+        """Test static assets get no request id or request logs"""
+        from flask import Flask
+        from structured_logging import RequestTracker
+        
+        app = Flask(__name__, static_folder=None)
+        app.add_url_rule('/static/<path:filename>', endpoint='static', view_func=lambda filename: 'x')
+        RequestTracker(app)
+        
+        with patch.object(StructuredLogger, 'log_template') as mock_log:
+            response = app.test_client().get('/static/app.css')
+        
+        mock_log.assert_not_called()
+        self.assertNotIn('X-Request-ID', response.headers)
+    
+    def test_response_size_does_not_consume_stream(self):
+        """Test response size is read from the buffered body or header only"""
+        from flask import Response
+        from structured_logging import _response_size
+        
+        self.assertEqual(_response_size(Response("hello")), 5)
+        
+        streamed = Response(iter([b"a", b"b"]))
+        self.assertIsNone(_response_size(streamed))
+        self.assertFalse(streamed.is_sequence)
+    
+    def test_filtered_levels_skip_context(self):
+        """Test suppressed levels return before building log context"""
+        with patch.object(self.logger, '_get_context') as mock_context:
+            self.logger.debug("Not emitted at INFO level")
+        
+        mock_context.assert_not_called()
+        
+        with patch.object(self.logger.logger, 'isEnabledFor', return_value=False), \
+             patch.object(self.logger, 'info') as mock_info:
+            self.logger.log_business_event("ignored")
+        
+        mock_info.assert_not_called()
+    
+    def test_request_context_cached_per_request(self):
+        """Test request fields are read once per request and reused"""
+        from flask import Flask, g
+        
+        app = Flask(__name__)
+        with app.test_request_context('/api/test', headers={'User-Agent': 'test-agent'}):
+            g.request_id = 'req-1'
+            
+            first = self.logger._get_context()
+            self.assertEqual(first['request_id'], 'req-1')
+            self.assertEqual(first['method'], 'GET')
+            self.assertEqual(first['user_agent'], 'test-agent')
+            
+            with patch('structured_logging._request_log_context') as mock_build:
+                second = self.logger._get_context()
+            
+            mock_build.assert_not_called()
+            self.assertEqual(second['url'], first['url'])
+    
     def test_performance_logging(self):
         """Test performance logging decorator"""
         @log_performance("test_operation")
@@ -136,6 +291,34 @@ class TestErrorTracking(unittest.TestCase):
         self.assertIn("total_errors", stats)
         self.assertIn("error_types", stats)
         self.assertEqual(stats["total_errors"], 5)
+    
+    def test_error_counts_by_type(self):
+        """Test per-type counts, including types registered after others"""
+        for error in [ValueError("v")] * 5 + [KeyError("k")] * 2:
+            self.tracker.track_error(error)
+        
+        stats = self.tracker.get_error_stats()
+        self.assertEqual(stats["error_types"], {"ValueError": 5, "KeyError": 2})
+        self.assertEqual(stats["total_errors"], 7)
+        
+        # A new type gets the next slot without disturbing existing counts
+        self.tracker.track_error(TypeError("t"))
+        self.tracker.track_error(ValueError("v"))
+        
+        stats = self.tracker.get_error_stats()
+        self.assertEqual(stats["error_types"], {"ValueError": 6, "KeyError": 2, "TypeError": 1})
+        self.assertEqual(stats["last_error"]["type"], "ValueError")
+    
+    def test_error_types_with_same_name_are_summed(self):
+        """Test distinct classes sharing a name report one combined count"""
+        FirstError = type("CustomError", (Exception,), {})
+        SecondError = type("CustomError", (Exception,), {})
+        
+        self.tracker.track_error(FirstError())
+        self.tracker.track_error(SecondError())
+        self.tracker.track_error(SecondError())
+        
+        self.assertEqual(self.tracker.get_error_stats()["error_types"], {"CustomError": 3})
 
 
 class TestGracefulDegradation(unittest.TestCase):
@@ -0,0 +1,90 @@
+import pytest
+import pandas as pd
+from typing import Any, Dict
+from unittest.mock import Mock, patch
+
+from import_utils import DataImporter, PollingPlaceImporter
+
+
+def _scalar_errors(importer, df):
+    """Run validate_coordinates row by row the way the import loop used to"""
+    errors = []
+    for _, row in df.iterrows():
+        data: Dict[str, Any] = {}
+        for col in df.columns:
+            value = row[col]
+            if pd.isna(value):
+                data[col] = None
+            else:
+                data[col] = str(value).strip() if isinstance(value, str) else value
+
+        is_valid, error_msg = importer.validate_coordinates(data.get('latitude'), data.get('longitude'))
+        errors.append(None if is_valid else error_msg)
+    return errors
+
+
+class TestValidateCoordinatesBatch:
+    """Test the vectorized coordinate validator against the scalar one"""
+
+    @pytest.mark.parametrize("columns", [
+        {
+            'latitude': ['40.0', '', '  ', 'abc', 'nan', 'NaN', '95', '-91', '45', '45', 'inf', None, 39.5, ' 41.2 '],
+            'longitude': ['-83.0', '-83.0', '-83.0', '-83.0', '-83.0', '-83.0', '-83.0', 'xyz', '200', 'nan', '0', '-181', None, '-82'],
+        },
+        {'latitude': ['40.0', '', 'abc', 'nan', '95', None]},
+        {'longitude': ['-83.0', '', 'abc', 'nan', '200', None]},
+        {'latitude': [40.0, float('nan'), 100.0], 'longitude': [-83.0, -83.0, float('nan')]},
+        # float() accepts these but pd.to_numeric does not
+        {
+            'latitude': ['1_0', '٣', '9_5', ' 4_0 ', '40'],
+            'longitude': ['-8_3', '-83', '-83', '-83', '١٨١'],
+        },
+    ])
+    def test_batch_matches_scalar(self, columns):
+        """Test each row gets the same message as validate_coordinates"""
+        importer = DataImporter(db_session=None)
+        df = pd.DataFrame(columns)
+
+        batch = importer.validate_coordinates_batch(df)
+
+        assert list(batch.index) == list(df.index)
+        assert batch.tolist() == _scalar_errors(importer, df)
+
+    def test_nan_literal_reports_range_error(self):
+        """Test a literal "nan" cell fails the range check, not the format check"""
+        importer = DataImporter(db_session=None)
+        df = pd.DataFrame({'latitude': ['nan'], 'longitude': ['-83.0']})
+
+        assert importer.validate_coordinates_batch(df).tolist() == ["Latitude must be between -90 and 90"]
+
+
+class TestPollingPlaceImporterProcessDataframe:
+    """Test process_dataframe reports coordinate errors per row"""
+
+    def test_coordinate_errors_reported_per_row(self):
+        """Test rows with bad coordinates are skipped with the scalar messages"""
+        db_session = Mock()
+        importer = PollingPlaceImporter(db_session)
+        df = pd.DataFrame({
+            'id': ['pp-1', 'pp-2', 'pp-3', 'pp-4'],
+            'name': ['A', 'B', 'C', 'D'],
+            'city': ['Columbus'] * 4,
+            'state': ['OH'] * 4,
+            'zip_code': ['43215'] * 4,
+            'latitude': ['40.0', 'abc', '95', 'nan'],
+            'longitude': ['-83.0', '-83.0', '-83.0', '-83.0'],
+        })
+
+        with patch('import_utils.PollingPlace') as mock_model, \
+                patch.object(importer, 'create_audit_entry'):
+            mock_model.query.get.return_value = None
+            success, _ = importer.process_dataframe(df)
+
+        assert success is True
+        assert importer.imported_count == 1
+        assert importer.errors == [
+            "Row 2: Invalid coordinate format",
+            "Row 3: Latitude must be between -90 and 90",
+            "Row 4: Latitude must be between -90 and 90",
+        ]
+        db_session.commit.assert_called_once()
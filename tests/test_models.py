@@ -2,11 +2,12 @@ import pytest
 import json
 from datetime import datetime, date
 from unittest.mock import Mock, patch, MagicMock
-import sys
 import os
+import sys
 
-# Add the parent directory to the path to import the modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# A direct run puts tests/ rather than the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import (
     PollingPlace, Precinct, PrecinctAssignment, Election, 
@@ -13,14 +13,14 @@ import pytest
 import unittest
 from unittest.mock import Mock, patch, MagicMock, call
 import os
-import sys
 import inspect
-
-# Import the plugin manager and base plugin
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# A direct run puts tests/ rather than the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import the plugin manager and base plugin
 from plugins.plugin_manager import PluginManager
 from plugins.base_plugin import BasePlugin
 
@@ -266,26 +266,4 @@ class TestPluginManagerErrorScenarios(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [
-        TestPluginDiscovery,
-        TestPluginManagerErrorScenarios
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Print summary
-    print(f"\nTest Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
\ No newline at end of file
+    pytest.main([__file__])
@@ -16,12 +16,14 @@ from io import BytesIO
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-
-# Import the plugin and models
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import sys
 
+# A direct run puts tests/ rather than the project root on sys.path
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import the plugin and models
 from plugins.virginia import VirginiaPlugin
 from models import PollingPlace, Precinct, PrecinctAssignment, Election
 
@@ -845,30 +847,4 @@ class TestVirginiaGeocoding(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [
-        TestVirginiaFileDiscovery,
-        TestVirginiaDataParsing,
-        TestVirginiaSyncWorkflow,
-        TestVirginiaDataValidation,
-        TestVirginiaErrorScenarios,
-        TestVirginiaGeocoding
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Print summary
-    print(f"\nTest Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
\ No newline at end of file
+    pytest.main([__file__])
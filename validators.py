@@ -6,6 +6,11 @@ import re
 from datetime import datetime
 from typing import Tuple, Optional, Dict, Any
 
+# Bounded quantifiers keep matching linear on crafted input (ReDoS)
+EMAIL_PATTERN = re.compile(
+    r'^[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]{1,63}(?:\.[A-Za-z0-9-]{1,63})*\.[A-Za-z]{2,24}$'
+)
+
 
 class ValidationError(Exception):
     """Custom validation error"""
@@ -147,10 +152,7 @@ class DataValidator:
         
         email = str(email).strip()
         
-        # Basic email regex
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if not re.match(email_pattern, email):
+        if not EMAIL_PATTERN.match(email):
             return False, "Invalid email format"
         
         return True, None